@@ -0,0 +1 @@
+A failed load now builds the line index of each source file once and reuses it for every field error, instead of re-scanning the document per error. The index belongs to that load and is dropped with it.
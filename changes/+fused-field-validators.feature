@@ -0,0 +1 @@
+All predicates on a field, such as ``(V > 0) & (V < 65536) & (V != 22)``, are now checked by a single generated validator instead of one adaptix validator each. Error messages and evaluation order are unchanged.
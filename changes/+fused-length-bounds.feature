@@ -0,0 +1 @@
+Adjacent ``V.len()`` bounds on a field, such as ``(V.len() >= 3) & (V.len() <= 20)``, are checked as one range with a single ``len()`` call.
@@ -0,0 +1 @@
+``V.matches()`` predicates with the same pattern share one compiled regex.
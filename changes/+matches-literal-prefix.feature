@@ -0,0 +1 @@
+``V.matches()`` checks patterns that are a plain literal prefix with ``str.startswith`` instead of running the regex engine.
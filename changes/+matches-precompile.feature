@@ -0,0 +1 @@
+``V.matches(...)`` now compiles its pattern when the predicate is created, so an invalid regular expression raises ``re.error`` at schema definition instead of when the first config is loaded.
@@ -0,0 +1 @@
+``V.matches()`` accepts ``engine="re2"`` to run the pattern on RE2 (``dature[re2]`` extra), a linear-time engine; patterns RE2 cannot compile raise ``ValueError``.
@@ -0,0 +1 @@
+Added the optional `dature[orjson]` extra. When installed, `JsonSource` parses files with `orjson`, falling back to the stdlib parser for input orjson handles differently (NaN/Infinity, a UTF-8 BOM, integers outside the 64-bit range) so results and error messages stay the same. JSON files are now read as bytes and decoded as UTF-8/16/32 per the JSON spec instead of with the locale encoding, so a file starting with a UTF-8 BOM now loads instead of failing with "Unexpected UTF-8 BOM".
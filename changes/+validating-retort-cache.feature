@@ -0,0 +1 @@
+Repeated ``load()`` calls for the same schema and an alike-configured source now reuse the compiled validating retort instead of rebuilding it each time. Source ``validators`` and ``root_validators`` count as alike only when they are the same objects, and the 128 most recently used retorts are kept.
@@ -23,7 +23,7 @@ from dature.errors.exceptions import (
     FieldLoadError,
     MissingEnvVarError,
 )
-from dature.errors.location import ErrorContext, read_file_content, resolve_source_location
+from dature.errors.location import ErrorContext, read_error_file_content, resolve_source_location
 from dature.masking.masking import is_random_string, mask_value
 
 if TYPE_CHECKING:
@@ -127,7 +127,7 @@ def handle_load_errors[T](
     try:
         return func()
     except EnvVarExpandError as exc:
-        file_content = read_file_content(ctx.source.file_path_for_errors())
+        file_content = read_error_file_content(ctx)
         enriched_env: list[MissingEnvVarError] = []
         for e in exc.exceptions:
             if not isinstance(e, MissingEnvVarError):
@@ -137,7 +137,7 @@ def handle_load_errors[T](
             enriched_env.append(e)
         raise EnvVarExpandError(enriched_env, dataclass_name=ctx.dataclass_name) from exc
     except (AggregateLoadError, LoadError) as exc:
-        file_content = read_file_content(ctx.source.file_path_for_errors())
+        file_content = read_error_file_content(ctx)
         heuristic_paths: set[str] = set()
         field_errors: list[FieldLoadError] = []
         _walk_exception(
@@ -1,5 +1,6 @@
+import io
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -12,13 +13,54 @@ if TYPE_CHECKING:
     from dature.sources.base import Source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorContext:
     dataclass_name: str
     source: "Source"
     secret_paths: frozenset[str] = frozenset()
     mask_secrets: bool = False
     nested_conflicts: NestedConflicts | None = None
+    loaded_bytes: bytes | None = None
+
+    def file_content_for_errors(self) -> str | None:
+        if self.loaded_bytes is None:
+            return self.source.file_content_for_errors()
+        # Decoded like Path.read_text: locale encoding, universal newlines.
+        return io.TextIOWrapper(io.BytesIO(self.loaded_bytes)).read()
+
+
+@dataclass(slots=True)
+class FileContent:
+    """Text of a source file for error locations, read once per load.
+
+    The line split and path finders are built on first use and live as long as this
+    object, which the load that read the file holds, so a failed load indexes its file
+    once however many errors it reports.
+    """
+
+    text: str
+    _lines: tuple[str, ...] | None = field(default=None, init=False, repr=False)
+    _path_finders: dict[type[PathFinder], PathFinder] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def lines(self) -> tuple[str, ...]:
+        if self._lines is None:
+            self._lines = tuple(self.text.splitlines())
+        return self._lines
+
+    def path_finder(self, path_finder_class: type[PathFinder]) -> PathFinder:
+        finder = self._path_finders.get(path_finder_class)
+        if finder is None:
+            finder = path_finder_class(self.text)
+            self._path_finders[path_finder_class] = finder
+        return finder
+
+
+def read_error_file_content(ctx: ErrorContext) -> FileContent | None:
+    text = ctx.file_content_for_errors()
+    if text is None:
+        return None
+    return FileContent(text)
 
 
 def read_file_content(file_path: Path | None) -> str | None:
@@ -44,13 +86,13 @@ def _ranges_overlap(a: LineRange, b: LineRange) -> bool:
 
 def _secret_overlaps_lines(
     *,
-    file_content: str,
+    file_content: FileContent,
     line_range: LineRange,
     secret_paths: frozenset[str],
     prefix: str | None,
     path_finder_class: type[PathFinder],
 ) -> bool:
-    finder = path_finder_class(file_content)
+    finder = file_content.path_finder(path_finder_class)
     for secret_path in secret_paths:
         search_path = _build_search_path(secret_path.split("."), prefix)
         secret_range = finder.find_line_range(search_path)
@@ -72,7 +114,7 @@ def _resolve_conflict(
 def _apply_masking(
     locations: list[SourceLocation],
     ctx: ErrorContext,
-    file_content: str | None,
+    file_content: FileContent | None,
     *,
     is_secret: bool,
     field_path: list[str],
@@ -126,14 +168,14 @@ def _apply_masking(
 def resolve_source_location(
     field_path: list[str],
     ctx: ErrorContext,
-    file_content: str | None,
+    file_content: FileContent | None,
     *,
     input_value: JSONValue = None,
 ) -> list[SourceLocation]:
     is_secret = ".".join(field_path) in ctx.secret_paths
     conflict = _resolve_conflict(field_path, ctx)
 
-    locations = ctx.source.resolve_location(
+    locations = ctx.source._resolve_indexed_location(  # noqa: SLF001
         field_path=field_path,
         file_content=file_content,
         nested_conflict=conflict,
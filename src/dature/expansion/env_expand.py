@@ -148,11 +148,13 @@ def _expand_string_default(text: str) -> str:
     return _VAR_RE.sub(_replace, text)
 
 
-def expand_file_path(file_path: FilePath, *, mode: ExpandEnvVarsMode) -> str:
-    expanded = expand_string(str(file_path), mode=mode)
-    if isinstance(file_path, Path):
-        return str(Path(expanded))
-    return expanded
+def expand_file_path(file_path: FilePath, *, mode: ExpandEnvVarsMode) -> FilePath:
+    if isinstance(file_path, str):
+        return expand_string(file_path, mode=mode)
+    raw = str(file_path)
+    expanded = expand_string(raw, mode=mode)
+    # A Path stays a Path, so sources don't rebuild it from a string on every access.
+    return file_path if expanded == raw else Path(expanded)
 
 
 def expand_env_vars(data: JSONValue, *, mode: ExpandEnvVarsMode) -> JSONValue:
@@ -1,4 +1,5 @@
-from dataclasses import dataclass, fields, is_dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from typing import Any, TypeVar, get_type_hints, overload
 
 from dature.protocols import DataclassInstance
@@ -6,16 +7,23 @@ from dature.protocols import DataclassInstance
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=128)
+def _field_types(dataclass_type: type) -> dict[str, Any]:
+    """Return ``{field name: resolved type}`` for a dataclass, cached for recently used classes."""
+    hints = get_type_hints(dataclass_type)
+    return {f.name: hints[f.name] for f in fields(dataclass_type)}
+
+
 def resolve_field_type(owner: type, parts: tuple[str, ...]) -> type | None:
     """Walk the field chain and return the type of the last field, or None if not a dataclass."""
     current = owner
     for part in parts:
         if not is_dataclass(current):
             return None
-        hints = get_type_hints(current)
-        if part not in hints:
+        field_types = _field_types(current)
+        if part not in field_types:
             return None
-        current = hints[part]
+        current = field_types[part]
     if not is_dataclass(current):
         return None
     return current
@@ -30,8 +38,7 @@ def _validate_field(owner: type, parts: tuple[str, ...], name: str) -> None:
             return
         target = resolved
 
-    field_names = {f.name for f in fields(target)}
-    if name not in field_names:
+    if name not in _field_types(target):
         msg = f"'{target.__name__}' has no field '{name}'"
         raise AttributeError(msg)
 
@@ -41,6 +48,10 @@ def _validate_field(owner: type, parts: tuple[str, ...], name: str) -> None:
 class FieldPath:
     owner: type | str
     parts: tuple[str, ...] = ()
+    _path: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_path", ".".join(self.parts))
 
     def __getattr__(self, name: str) -> "FieldPath":
         if isinstance(self.owner, type):
@@ -51,7 +62,7 @@ class FieldPath:
         if not self.parts:
             msg = "FieldPath must contain at least one field name"
             raise ValueError(msg)
-        return ".".join(self.parts)
+        return self._path
 
 
 # --8<-- [end:field-path]
@@ -85,6 +96,8 @@ def extract_field_path(predicate: Any, schema: type[DataclassInstance] | None =
 
 # --8<-- [start:field-path-factory]
 class _FieldPathFactory:
+    __slots__ = ()
+
     @overload
     def __getitem__(self, owner: type[T]) -> T: ...
 
@@ -1,8 +1,10 @@
 import contextlib
 import logging
 from collections.abc import Callable
-from dataclasses import Field, asdict, fields, is_dataclass
+from dataclasses import asdict, fields, is_dataclass
 from enum import Flag
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Protocol, cast, get_type_hints, runtime_checkable
 
 from adaptix import Retort
@@ -13,29 +15,38 @@ from dature.field_path import FieldPath, extract_field_path
 from dature.protocols import DataclassInstance
 from dature.skip_field_provider import FilterResult, filter_invalid_fields
 from dature.sources.base import Source
-from dature.sources.retort import create_probe_retort
+from dature.sources.retort import get_probe_retort
 from dature.types import JSONValue, NestedConflicts
 
 logger = logging.getLogger("dature")
 
 
+@lru_cache(maxsize=128)
+def _flag_field_names(schema: type[DataclassInstance]) -> tuple[str, ...]:
+    type_hints = get_type_hints(schema)
+    return tuple(
+        field.name
+        for field in fields(schema)
+        if isinstance(hint := type_hints.get(field.name), type) and issubclass(hint, Flag)
+    )
+
+
 def coerce_flag_fields[T](data: JSONValue, schema: type[T]) -> JSONValue:
     if not isinstance(data, dict) or not is_dataclass(schema):
         return data
 
-    type_hints = get_type_hints(schema)
+    flag_names = _flag_field_names(cast("type[DataclassInstance]", schema))
+    if not flag_names:
+        return data
+
     coerced = dict(data)
-    for field in fields(cast("type[DataclassInstance]", schema)):
-        hint = type_hints.get(field.name)
-        if hint is None:
-            continue
-        if isinstance(hint, type) and issubclass(hint, Flag):
-            value = coerced.get(field.name)
-            if isinstance(value, str):
-                with contextlib.suppress(ValueError):
-                    coerced[field.name] = int(value)
-            elif isinstance(value, Flag):
-                coerced[field.name] = value.value
+    for name in flag_names:
+        value = coerced.get(name)
+        if isinstance(value, str):
+            with contextlib.suppress(ValueError):
+                coerced[name] = int(value)
+        elif isinstance(value, Flag):
+            coerced[name] = value.value
     return coerced
 
 
@@ -46,6 +57,7 @@ def build_error_ctx(
     secret_paths: frozenset[str] = frozenset(),
     mask_secrets: bool = False,
     nested_conflicts: NestedConflicts | None = None,
+    loaded_bytes: bytes | None = None,
 ) -> ErrorContext:
     return ErrorContext(
         dataclass_name=dataclass_name,
@@ -53,18 +65,27 @@ def build_error_ctx(
         secret_paths=secret_paths,
         mask_secrets=mask_secrets,
         nested_conflicts=nested_conflicts,
+        loaded_bytes=loaded_bytes,
     )
 
 
+@lru_cache(maxsize=128)
+def _allowed_field_paths(
+    skip_value: tuple[FieldPath, ...],
+    schema: type[DataclassInstance] | None,
+) -> frozenset[str]:
+    return frozenset(extract_field_path(field_path, schema) for field_path in skip_value)
+
+
 def get_allowed_fields(
     *,
     skip_value: bool | tuple[FieldPath, ...],
     schema: type[DataclassInstance] | None = None,
-) -> set[str] | None:
+) -> frozenset[str] | None:
     if skip_value is True:
         return None
     if isinstance(skip_value, tuple):
-        return {extract_field_path(field_path, schema) for field_path in skip_value}
+        return _allowed_field_paths(skip_value, schema)
     return None
 
 
@@ -74,7 +95,7 @@ def apply_skip_invalid(
     skip_field_if_invalid: bool | tuple[FieldPath, ...] | None,
     source: Source,
     schema: type[DataclassInstance],
-    log_prefix: str,
+    source_index: int | None = None,
     probe_retort: Retort | None = None,
 ) -> FilterResult:
     if not skip_field_if_invalid:
@@ -83,37 +104,52 @@ def apply_skip_invalid(
     allowed_fields = get_allowed_fields(skip_value=skip_field_if_invalid, schema=schema)
 
     if probe_retort is None:
-        probe_retort = create_probe_retort(source)
+        probe_retort = get_probe_retort(source, schema)
 
     result = filter_invalid_fields(raw, probe_retort, schema, allowed_fields)
     for path in result.skipped_paths:
-        logger.warning(
-            "%s Skipped invalid field '%s'",
-            log_prefix,
-            path,
-        )
+        if source_index is None:
+            logger.warning("[%s] Skipped invalid field '%s'", schema.__name__, path)
+        else:
+            logger.warning("[%s] Source %d: Skipped invalid field '%s'", schema.__name__, source_index, path)
     return result
 
 
 def merge_fields(
     loaded_data: DataclassInstance,
-    field_list: tuple[Field[Any], ...],
+    field_names: tuple[str, ...],
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
 ) -> dict[str, Any]:
-    explicit_fields = set(kwargs.keys())
-    for i, _ in enumerate(args):
-        if i < len(field_list):
-            explicit_fields.add(field_list[i].name)
+    # Positional args claim the leading fields; only the rest may need loaded values.
+    unclaimed = [name for name in field_names[len(args) :] if name not in kwargs]
+    if not unclaimed:
+        return dict(kwargs)
 
     complete_kwargs = dict(kwargs)
-    for field in field_list:
-        if field.name not in explicit_fields:
-            complete_kwargs[field.name] = getattr(loaded_data, field.name)
+    for name in unclaimed:
+        complete_kwargs[name] = getattr(loaded_data, name)
 
     return complete_kwargs
 
 
+def make_fields_reader(field_names: tuple[str, ...]) -> Callable[[DataclassInstance], dict[str, Any]]:
+    """Build a reader that copies all ``field_names`` of a loaded instance into a dict.
+
+    Used when ``__init__`` is called without explicit arguments: every field comes from
+    the loaded instance, so the values are fetched with a single ``attrgetter`` call.
+    """
+    if not field_names:
+        return lambda _: {}
+
+    getter = attrgetter(*field_names)
+    if len(field_names) == 1:
+        (name,) = field_names
+        return lambda loaded_data: {name: getter(loaded_data)}
+
+    return lambda loaded_data: dict(zip(field_names, getter(loaded_data), strict=True))
+
+
 @runtime_checkable
 class PatchContext(Protocol):
     loading: bool
@@ -124,25 +160,35 @@ class PatchContext(Protocol):
     error_ctx: ErrorContext
 
 
-def make_validating_post_init(ctx: PatchContext) -> Callable[..., None]:
-    def new_post_init(self: DataclassInstance) -> None:
-        if ctx.loading:
-            return
+def validate_patched_instance(ctx: PatchContext, instance: DataclassInstance) -> None:
+    """Run field and root validators against an instance built by a patched ``__init__``.
+
+    ``ctx.validating`` is set for the duration so that the instance the validating
+    loader constructs goes straight to the original ``__init__``.
+    """
+    ctx.validating = True
+    try:
+        obj_dict = coerce_flag_fields(asdict(instance), ctx.cls)
+        handle_load_errors(
+            func=lambda: ctx.validation_loader(obj_dict),
+            ctx=ctx.error_ctx,
+        )
+    finally:
+        ctx.validating = False
 
-        if ctx.validating:
-            return
 
-        if ctx.original_post_init is not None:
-            ctx.original_post_init(self)
+def make_guarded_post_init(
+    ctx: PatchContext,
+    original_post_init: Callable[..., None],
+) -> Callable[..., None]:
+    """Wrap the user's ``__post_init__`` so it only runs for the instance the caller asked for.
 
-        ctx.validating = True
-        try:
-            obj_dict = coerce_flag_fields(asdict(self), ctx.cls)
-            handle_load_errors(
-                func=lambda: ctx.validation_loader(obj_dict),
-                ctx=ctx.error_ctx,
-            )
-        finally:
-            ctx.validating = False
+    Intermediate instances built while loading or validating skip it.
+    """
+
+    def guarded_post_init(self: DataclassInstance) -> None:
+        if ctx.loading or ctx.validating:
+            return
+        original_post_init(self)
 
-    return new_post_init
+    return guarded_post_init
@@ -1,7 +1,7 @@
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass as stdlib_dataclass
-from dataclasses import fields, is_dataclass
+from dataclasses import fields
 from typing import Any
 
 from dature.errors import DatureConfigError, SourceLoadError
@@ -17,8 +17,10 @@ from dature.loading.common import resolve_mask_secrets
 from dature.loading.context import (
     build_error_ctx,
     coerce_flag_fields,
-    make_validating_post_init,
+    make_fields_reader,
+    make_guarded_post_init,
     merge_fields,
+    validate_patched_instance,
 )
 from dature.loading.merge_config import MergeConfig
 from dature.loading.source_loading import resolve_type_loaders
@@ -30,8 +32,8 @@ from dature.merging.predicate import ResolvedFieldGroup, build_field_group_paths
 from dature.protocols import DataclassInstance
 from dature.sources.base import Source
 from dature.sources.retort import (
-    create_validating_retort,
     ensure_retort,
+    get_validating_retort,
     transform_to_dataclass,
 )
 from dature.strategies.source import (
@@ -377,7 +379,7 @@ def merge_load_as_function[T: DataclassInstance](
     )
 
     last_type_loaders = data.last_type_loaders
-    validating_retort = create_validating_retort(
+    validating_retort = get_validating_retort(
         data.last_source,
         schema,
         resolved_type_loaders=last_type_loaders,
@@ -427,7 +429,8 @@ class _MergePatchContext:
         self.cache = cache
         self.debug = debug
         self.cached_data: DataclassInstance | None = None
-        self.field_list = fields(cls)
+        self.field_names = tuple(field.name for field in fields(cls))
+        self.read_loaded_fields = make_fields_reader(self.field_names)
         self.original_init = cls.__init__
         self.original_post_init = getattr(cls, "__post_init__", None)
         self.loading = False
@@ -435,7 +438,7 @@ class _MergePatchContext:
 
         last_source = merge_meta.sources[-1]
         last_type_loaders = resolve_type_loaders(last_source, merge_meta.type_loaders)
-        validating_retort = create_validating_retort(
+        validating_retort = get_validating_retort(
             last_source,
             cls,
             resolved_type_loaders=last_type_loaders,
@@ -468,7 +471,7 @@ class _MergePatchContext:
 
 def _make_merge_new_init(ctx: _MergePatchContext) -> Callable[..., None]:
     def new_init(self: DataclassInstance, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
-        if ctx.loading:
+        if ctx.loading or ctx.validating:
             ctx.original_init(self, *args, **kwargs)
             return
 
@@ -494,7 +497,10 @@ def _make_merge_new_init(ctx: _MergePatchContext) -> Callable[..., None]:
             if ctx.cache:
                 ctx.cached_data = loaded_data
 
-        complete_kwargs = merge_fields(loaded_data, ctx.field_list, args, kwargs)
+        if args or kwargs:
+            complete_kwargs = merge_fields(loaded_data, ctx.field_names, args, kwargs)
+        else:
+            complete_kwargs = ctx.read_loaded_fields(loaded_data)
         ctx.original_init(self, *args, **complete_kwargs)
 
         if ctx.debug:
@@ -502,8 +508,7 @@ def _make_merge_new_init(ctx: _MergePatchContext) -> Callable[..., None]:
             if report is not None:
                 attach_load_report(self, report)
 
-        if ctx.original_post_init is None:
-            self.__post_init__()  # type: ignore[attr-defined]
+        validate_patched_instance(ctx, self)
 
     return new_init
 
@@ -515,7 +520,7 @@ def merge_make_decorator(
     debug: bool,
 ) -> Callable[[type[DataclassInstance]], type[DataclassInstance]]:
     def decorator(cls: type[DataclassInstance]) -> type[DataclassInstance]:
-        if not is_dataclass(cls):
+        if not isinstance(cls, type) or not hasattr(cls, "__dataclass_fields__"):
             msg = f"{cls.__name__} must be a dataclass"
             raise TypeError(msg)
 
@@ -526,7 +531,8 @@ def merge_make_decorator(
             debug=debug,
         )
         cls.__init__ = _make_merge_new_init(ctx)  # type: ignore[method-assign]
-        cls.__post_init__ = make_validating_post_init(ctx)  # type: ignore[attr-defined]
+        if ctx.original_post_init is not None:
+            cls.__post_init__ = make_guarded_post_init(ctx, ctx.original_post_init)  # type: ignore[attr-defined]
         return cls
 
     return decorator
@@ -1,19 +1,21 @@
 import logging
 from collections.abc import Callable
-from dataclasses import asdict, fields, is_dataclass
+from dataclasses import asdict, fields
 from typing import TYPE_CHECKING, Any
 
 from dature.errors import DatureConfigError
 from dature.errors.formatter import enrich_skipped_errors, handle_load_errors
-from dature.errors.location import read_file_content
+from dature.errors.location import read_error_file_content
 from dature.load_report import FieldOrigin, LoadReport, SourceEntry, attach_load_report
 from dature.loading.common import resolve_mask_secrets
 from dature.loading.context import (
     apply_skip_invalid,
     build_error_ctx,
     coerce_flag_fields,
-    make_validating_post_init,
+    make_fields_reader,
+    make_guarded_post_init,
     merge_fields,
+    validate_patched_instance,
 )
 from dature.loading.merge_config import SourceParams, apply_source_init_params
 from dature.loading.source_loading import (
@@ -25,9 +27,9 @@ from dature.masking.masking import mask_json_value
 from dature.protocols import DataclassInstance
 from dature.sources.base import Source
 from dature.sources.retort import (
-    create_probe_retort,
-    create_validating_retort,
     ensure_retort,
+    get_probe_retort,
+    get_validating_retort,
     transform_to_dataclass,
 )
 from dature.types import JSONValue
@@ -119,7 +121,7 @@ class _PatchContext:
     ) -> None:
         self.type_loaders = type_loaders
         ensure_retort(source, cls, resolved_type_loaders=self.type_loaders)
-        validating_retort = create_validating_retort(
+        validating_retort = get_validating_retort(
             source,
             cls,
             resolved_type_loaders=self.type_loaders,
@@ -130,7 +132,8 @@ class _PatchContext:
         self.cache = cache
         self.debug = debug
         self.cached_data: DataclassInstance | None = None
-        self.field_list = fields(cls)
+        self.field_names = tuple(field.name for field in fields(cls))
+        self.read_loaded_fields = make_fields_reader(self.field_names)
         self.original_init = cls.__init__
         self.original_post_init = getattr(cls, "__post_init__", None)
         self.validation_loader: Callable[[JSONValue], DataclassInstance] = validating_retort.get_loader(cls)
@@ -155,8 +158,7 @@ class _PatchContext:
         # probe_retort is created early so adaptix sees the original signature
         self.probe_retort: Retort | None = None
         if source.skip_field_if_invalid:
-            self.probe_retort = create_probe_retort(source, resolved_type_loaders=self.type_loaders)
-            self.probe_retort.get_loader(cls)
+            self.probe_retort = get_probe_retort(source, cls, resolved_type_loaders=self.type_loaders)
 
 
 def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
@@ -166,13 +168,17 @@ def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
     )
     raw_data = load_result.data
 
-    if load_result.nested_conflicts:
-        ctx.error_ctx = build_error_ctx(
+    # Scoped to this load: the context may hold the raw file bytes, which must not
+    # outlive it on the long-lived patch context.
+    error_ctx = ctx.error_ctx
+    if load_result.nested_conflicts or load_result.loaded_bytes is not None:
+        error_ctx = build_error_ctx(
             ctx.source,
             ctx.cls.__name__,
             secret_paths=ctx.secret_paths,
             mask_secrets=ctx.error_ctx.mask_secrets,
             nested_conflicts=load_result.nested_conflicts,
+            loaded_bytes=load_result.loaded_bytes,
         )
 
     filter_result = apply_skip_invalid(
@@ -180,17 +186,16 @@ def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
         skip_field_if_invalid=ctx.source.skip_field_if_invalid,
         source=ctx.source,
         schema=ctx.cls,
-        log_prefix=f"[{ctx.cls.__name__}]",
         probe_retort=ctx.probe_retort,
     )
     raw_data = filter_result.cleaned_dict
     raw_data = coerce_flag_fields(raw_data, ctx.cls)
 
     skipped_fields: dict[str, list[SkippedFieldSource]] = {}
-    file_content = read_file_content(ctx.error_ctx.source.file_path_for_errors())
+    file_content = read_error_file_content(error_ctx) if filter_result.skipped_paths else None
     for path in filter_result.skipped_paths:
         skipped_fields.setdefault(path, []).append(
-            SkippedFieldSource(source=ctx.source, error_ctx=ctx.error_ctx, file_content=file_content),
+            SkippedFieldSource(source=ctx.source, error_ctx=error_ctx, file_content=file_content),
         )
 
     def _transform(data: JSONValue = raw_data) -> DataclassInstance:
@@ -199,7 +204,7 @@ def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
     try:
         loaded_data = handle_load_errors(
             func=_transform,
-            ctx=ctx.error_ctx,
+            ctx=error_ctx,
         )
     except DatureConfigError as exc:
         if skipped_fields:
@@ -211,7 +216,7 @@ def _load_single_source(ctx: _PatchContext) -> DataclassInstance:
 
 def _make_new_init(ctx: _PatchContext) -> Callable[..., None]:
     def new_init(self: DataclassInstance, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
-        if ctx.loading:
+        if ctx.loading or ctx.validating:
             ctx.original_init(self, *args, **kwargs)
             return
 
@@ -235,7 +240,10 @@ def _make_new_init(ctx: _PatchContext) -> Callable[..., None]:
             if ctx.cache:
                 ctx.cached_data = loaded_data
 
-        complete_kwargs = merge_fields(loaded_data, ctx.field_list, args, kwargs)
+        if args or kwargs:
+            complete_kwargs = merge_fields(loaded_data, ctx.field_names, args, kwargs)
+        else:
+            complete_kwargs = ctx.read_loaded_fields(loaded_data)
         ctx.original_init(self, *args, **complete_kwargs)
 
         if ctx.debug:
@@ -249,8 +257,7 @@ def _make_new_init(ctx: _PatchContext) -> Callable[..., None]:
             )
             attach_load_report(self, report)
 
-        if ctx.original_post_init is None:
-            self.__post_init__()  # type: ignore[attr-defined]
+        validate_patched_instance(ctx, self)
 
     return new_init
 
@@ -283,7 +290,7 @@ def load_as_function(  # noqa: C901, PLR0913
 
     # Build the validating retort before reading raw data so that V-predicate
     # type-compatibility errors (ValidatorTypeError) surface before any file I/O.
-    validating_retort = create_validating_retort(
+    validating_retort = get_validating_retort(
         source,
         schema,
         resolved_type_loaders=resolved_type_loaders,
@@ -295,13 +302,14 @@ def load_as_function(  # noqa: C901, PLR0913
     )
     raw_data = load_result.data
 
-    if load_result.nested_conflicts:
+    if load_result.nested_conflicts or load_result.loaded_bytes is not None:
         error_ctx = build_error_ctx(
             source,
             schema.__name__,
             secret_paths=secret_paths,
             mask_secrets=resolved_mask_secrets,
             nested_conflicts=load_result.nested_conflicts,
+            loaded_bytes=load_result.loaded_bytes,
         )
 
     filter_result = apply_skip_invalid(
@@ -309,12 +317,11 @@ def load_as_function(  # noqa: C901, PLR0913
         skip_field_if_invalid=source.skip_field_if_invalid,
         source=source,
         schema=schema,
-        log_prefix=f"[{schema.__name__}]",
     )
     raw_data = filter_result.cleaned_dict
 
     skipped_fields: dict[str, list[SkippedFieldSource]] = {}
-    file_content = read_file_content(error_ctx.source.file_path_for_errors())
+    file_content = read_error_file_content(error_ctx) if filter_result.skipped_paths else None
     for path in filter_result.skipped_paths:
         skipped_fields.setdefault(path, []).append(
             SkippedFieldSource(source=source, error_ctx=error_ctx, file_content=file_content),
@@ -392,7 +399,7 @@ def make_decorator(  # noqa: PLR0913
     resolved_type_loaders = resolve_type_loaders(source, type_loaders)
 
     def decorator(cls: type[DataclassInstance]) -> type[DataclassInstance]:
-        if not is_dataclass(cls):
+        if not isinstance(cls, type) or not hasattr(cls, "__dataclass_fields__"):
             msg = f"{cls.__name__} must be a dataclass"
             raise TypeError(msg)
 
@@ -406,7 +413,8 @@ def make_decorator(  # noqa: PLR0913
             type_loaders=resolved_type_loaders,
         )
         cls.__init__ = _make_new_init(ctx)  # type: ignore[method-assign]
-        cls.__post_init__ = make_validating_post_init(ctx)  # type: ignore[attr-defined]
+        if ctx.original_post_init is not None:
+            cls.__post_init__ = make_guarded_post_init(ctx, ctx.original_post_init)  # type: ignore[attr-defined]
         return cls
 
     return decorator
@@ -1,8 +1,8 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from dature.config import config
-from dature.errors.location import ErrorContext
+from dature.errors.location import ErrorContext, FileContent, read_error_file_content
 from dature.field_path import FieldPath
 from dature.loading.context import apply_skip_invalid
 from dature.loading.merge_config import MergeConfig
@@ -61,18 +61,28 @@ def apply_merge_skip_invalid(
         skip_field_if_invalid=skip_value,
         source=source,
         schema=schema,
-        log_prefix=f"[{schema.__name__}] Source {source_index}:",
+        source_index=source_index,
     )
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class SourceContext:
+    """Error context of a loaded source; the file is only read when a location is resolved."""
+
     error_ctx: ErrorContext
-    file_content: str | None
+    _file_content: FileContent | None = field(default=None, init=False, repr=False)
+    _file_content_read: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def file_content(self) -> FileContent | None:
+        if not self._file_content_read:
+            self._file_content = read_error_file_content(self.error_ctx)
+            self._file_content_read = True
+        return self._file_content
 
 
 @dataclass(frozen=True, slots=True)
 class SkippedFieldSource:
     source: Source
     error_ctx: ErrorContext
-    file_content: str | None
+    file_content: FileContent | None
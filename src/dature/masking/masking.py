@@ -1,13 +1,21 @@
+from functools import cache
+from typing import TYPE_CHECKING
+
 from dature.config import config
 from dature.load_report import FieldOrigin, SourceEntry
 from dature.types import JSONValue
 
-try:
+if TYPE_CHECKING:
     from random_string_detector import RandomStringDetector  # type: ignore[import-untyped]
 
-    _heuristic_detector: RandomStringDetector | None = RandomStringDetector(allow_numbers=True)
-except ImportError:
-    _heuristic_detector = None
+
+@cache
+def _get_heuristic_detector() -> "RandomStringDetector | None":
+    try:
+        from random_string_detector import RandomStringDetector  # noqa: PLC0415
+    except ImportError:
+        return None
+    return RandomStringDetector(allow_numbers=True)
 
 
 def mask_value(value: str) -> str:
@@ -127,7 +135,8 @@ def is_random_string(value: str) -> bool:
     if len(value) < cfg.min_heuristic_length:
         return False
 
-    if _heuristic_detector is None:
+    heuristic_detector = _get_heuristic_detector()
+    if heuristic_detector is None:
         return False
 
     word = value.lower()
@@ -136,6 +145,6 @@ def is_random_string(value: str) -> bool:
         return False
 
     uncommon = sum(
-        1 for b in bigrams if _heuristic_detector.bigrams.get(b, 0) <= _heuristic_detector.common_bigrams_threshold
+        1 for b in bigrams if heuristic_detector.bigrams.get(b, 0) <= heuristic_detector.common_bigrams_threshold
     )
     return uncommon / len(bigrams) > cfg.heuristic_threshold
@@ -1,3 +1,6 @@
+from collections import Counter
+from itertools import chain
+
 from dature.errors import MergeConflictError, MergeConflictFieldError, SourceLocation
 from dature.errors.location import resolve_source_location
 from dature.loading.source_loading import SourceContext
@@ -9,11 +12,13 @@ _MIN_CONFLICT_SOURCES = 2
 def deep_merge_last_wins(base: JSONValue, override: JSONValue) -> JSONValue:
     if isinstance(base, dict) and isinstance(override, dict):
         result = dict(base)
-        for key, value in override.items():
-            if key in result:
-                result[key] = deep_merge_last_wins(result[key], value)
-            else:
-                result[key] = value
+        result.update(override)
+        # Only keys present on both sides can need a nested merge.
+        for key in base.keys() & override.keys():
+            existing = base[key]
+            value = override[key]
+            if isinstance(existing, dict) and isinstance(value, dict):
+                result[key] = deep_merge_last_wins(existing, value)
         return result
     return override
 
@@ -22,10 +27,9 @@ def deep_merge_first_wins(base: JSONValue, override: JSONValue) -> JSONValue:
     if isinstance(base, dict) and isinstance(override, dict):
         result = dict(base)
         for key, value in override.items():
-            if key in result:
-                result[key] = deep_merge_first_wins(result[key], value)
-            else:
-                result[key] = value
+            existing = result.setdefault(key, value)
+            if existing is not value and isinstance(existing, dict) and isinstance(value, dict):
+                result[key] = deep_merge_first_wins(existing, value)
         return result
     return base
 
@@ -37,19 +41,14 @@ def _collect_conflicts(
     conflicts: list[tuple[list[str], list[tuple[int, JSONValue]]]],
     field_merge_paths: frozenset[str] | None = None,
 ) -> None:
-    key_sources: dict[str, list[tuple[int, JSONValue]]] = {}
-
-    for i, d in enumerate(dicts):
-        if not isinstance(d, dict):
-            continue
-        for key, value in d.items():
-            if key not in key_sources:
-                key_sources[key] = []
-            key_sources[key].append((i, value))
+    indexed_dicts = [(i, d) for i, d in enumerate(dicts) if isinstance(d, dict)]
+    # Count keys in C first; only keys shared by several sources can conflict.
+    key_counts = Counter(chain.from_iterable(d.keys() for _, d in indexed_dicts))
 
-    for key, sources in key_sources.items():
-        if len(sources) < _MIN_CONFLICT_SOURCES:
+    for key, count in key_counts.items():
+        if count < _MIN_CONFLICT_SOURCES:
             continue
+        sources = [(i, d[key]) for i, d in indexed_dicts if key in d]
 
         field_path = ".".join([*path, key])
         if field_merge_paths is not None and field_path in field_merge_paths:
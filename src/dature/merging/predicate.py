@@ -1,12 +1,14 @@
 from dataclasses import dataclass, fields, is_dataclass
-from typing import TYPE_CHECKING, get_type_hints
+from typing import TYPE_CHECKING, Any, get_type_hints
 
 from dature.field_path import FieldPath, extract_field_path, resolve_field_type
 from dature.protocols import DataclassInstance
 from dature.strategies.field import FieldMergeStrategy, resolve_field_strategy
 
 if TYPE_CHECKING:
-    from dature.types import FieldGroupTuple, FieldMergeMap
+    from collections.abc import Callable
+
+    from dature.types import FieldGroupTuple, FieldMergeMap, FieldMergeStrategyName
 
 
 @dataclass(frozen=True, slots=True)
@@ -23,17 +25,28 @@ def build_field_merge_map(
     if not field_merges:
         return {}
 
-    result: dict[str, FieldMergeStrategy] = {}
-    for predicate, strategy in field_merges.items():
-        path = extract_field_path(predicate, schema)
-        if isinstance(strategy, str):
-            result[path] = resolve_field_strategy(strategy, dataclass_name=dataclass_name)
-        elif callable(strategy):
-            result[path] = strategy
-        else:
-            msg = f"Invalid field merge strategy for {path!r}: expected name, callable, or FieldMergeStrategy instance"
-            raise TypeError(msg)
-    return result
+    return {
+        (path := extract_field_path(predicate, schema)): _resolve_merge_strategy(
+            path,
+            strategy,
+            dataclass_name=dataclass_name,
+        )
+        for predicate, strategy in field_merges.items()
+    }
+
+
+def _resolve_merge_strategy(
+    path: str,
+    strategy: "FieldMergeStrategyName | Callable[..., Any]",
+    *,
+    dataclass_name: str,
+) -> FieldMergeStrategy:
+    if isinstance(strategy, str):
+        return resolve_field_strategy(strategy, dataclass_name=dataclass_name)
+    if callable(strategy):
+        return strategy
+    msg = f"Invalid field merge strategy for {path!r}: expected name, callable, or FieldMergeStrategy instance"
+    raise TypeError(msg)
 
 
 def _expand_dataclass_fields(prefix: str, dc_type: type) -> list[str]:
@@ -1,4 +1,6 @@
 import json
+import re
+from bisect import bisect_left
 from collections.abc import Callable
 from dataclasses import dataclass
 from json.decoder import JSONArray, JSONObject, scanstring  # type: ignore[attr-defined]
@@ -13,6 +15,8 @@ if TYPE_CHECKING:
 
     _ScanOnce = Callable[[str, int], tuple["JSONValue", int]]
 
+_NEWLINE_RE = re.compile("\n")
+
 
 @dataclass(frozen=True, slots=True)
 class ExtractedKey:
@@ -34,8 +38,11 @@ def _build_json_line_map(content: str) -> dict[tuple[str, ...], LineRange]:
 
     decoder = json.JSONDecoder()
 
+    # Offsets of every newline, so a character index maps to its line with one bisect.
+    newline_offsets = [match.start() for match in _NEWLINE_RE.finditer(content)]
+
     def _char_to_line(idx: int) -> int:
-        return content.count("\n", 0, idx) + 1
+        return bisect_left(newline_offsets, idx) + 1
 
     def _wrapping_parse_object(
         s_and_end: tuple[str, int],
@@ -1,5 +1,5 @@
-import copy
 from collections.abc import Callable, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, replace
 from typing import cast
 
@@ -66,29 +66,49 @@ class ModelToDictProvider(ModelLoaderProvider):  # type: ignore[no-untyped-call]
         )
 
 
-def _collect_not_loaded_paths(data: ProbeDict, prefix: str) -> list[str]:
+def _collect_not_loaded_paths(
+    data: ProbeDict,
+    prefix: str,
+    allowed_fields: AbstractSet[str] | None,
+    allowed_parents: AbstractSet[str] | None,
+) -> list[str]:
     paths: list[str] = []
 
     for key, value in data.items():
-        current_path = f"{prefix}.{key}" if prefix else key
         if value is NOT_LOADED:
-            paths.append(current_path)
+            current_path = f"{prefix}.{key}" if prefix else key
+            if allowed_fields is None or current_path in allowed_fields:
+                paths.append(current_path)
         elif isinstance(value, dict):
-            paths.extend(_collect_not_loaded_paths(value, current_path))
+            current_path = f"{prefix}.{key}" if prefix else key
+            if allowed_parents is None or current_path in allowed_parents:
+                paths.extend(_collect_not_loaded_paths(value, current_path, allowed_fields, allowed_parents))
 
     return paths
 
 
-def _remove_path_from_dict(data: dict[str, JSONValue], path: str) -> None:
-    parts = path.split(".")
-    current: dict[str, JSONValue] = data
-    for part in parts[:-1]:
-        next_val = current.get(part)
-        if not isinstance(next_val, dict):
-            return
-        current = next_val
+def _parent_paths(paths: AbstractSet[str]) -> set[str]:
+    parents: set[str] = set()
+    for path in paths:
+        parts = path.split(".")
+        parents.update(".".join(parts[:i]) for i in range(1, len(parts)))
+    return parents
 
-    current.pop(parts[-1], None)
+
+def _without_path(data: dict[str, JSONValue], parts: list[str]) -> dict[str, JSONValue]:
+    # Copies only the dicts along the path; untouched subtrees are shared with ``data``.
+    head, *rest = parts
+    if head not in data:
+        return data
+    result = dict(data)
+    if not rest:
+        del result[head]
+        return result
+    nested = data[head]
+    if not isinstance(nested, dict):
+        return data
+    result[head] = _without_path(nested, rest)
+    return result
 
 
 @dataclass(frozen=True, slots=True)
@@ -101,25 +121,21 @@ def filter_invalid_fields(
     raw_dict: JSONValue,
     probe_retort: Retort,
     schema: type[DataclassInstance],
-    allowed_fields: set[str] | None,
+    allowed_fields: AbstractSet[str] | None,
 ) -> FilterResult:
-    if not isinstance(raw_dict, dict):
+    if not isinstance(raw_dict, dict) or (allowed_fields is not None and not allowed_fields):
         return FilterResult(cleaned_dict=raw_dict, skipped_paths=[])
 
+    # With an allow-list only the listed fields and the sections leading to them are walked.
+    allowed_parents = _parent_paths(allowed_fields) if allowed_fields is not None else None
     probed: ProbeDict = probe_retort.load(raw_dict, schema)
-    all_not_loaded = _collect_not_loaded_paths(probed, "")
-
-    skipped: list[str] = []
-    for path in all_not_loaded:
-        if allowed_fields is not None and path not in allowed_fields:
-            continue
-        skipped.append(path)
+    skipped = _collect_not_loaded_paths(probed, "", allowed_fields, allowed_parents)
 
     if not skipped:
         return FilterResult(cleaned_dict=raw_dict, skipped_paths=[])
 
-    cleaned: dict[str, JSONValue] = copy.deepcopy(raw_dict)
+    cleaned: dict[str, JSONValue] = raw_dict
     for path in skipped:
-        _remove_path_from_dict(cleaned, path)
+        cleaned = _without_path(cleaned, path.split("."))
 
     return FilterResult(cleaned_dict=cleaned, skipped_paths=skipped)
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from dature.config_paths import find_config
 from dature.errors import CaretSpan, LineRange, SourceLocation
+from dature.errors.location import FileContent, read_file_content
 from dature.expansion.env_expand import expand_env_vars, expand_file_path
 from dature.field_path import FieldPath
 from dature.path_finders.base import PathFinder
@@ -78,6 +79,9 @@ class Source(abc.ABC):
     def file_path_for_errors(self) -> Path | None:
         return None
 
+    def file_content_for_errors(self) -> str | None:
+        return read_file_content(self.file_path_for_errors())
+
     def display_name(self) -> str:
         return self.file_display() or self.format_name
 
@@ -134,8 +138,12 @@ class Source(abc.ABC):
         prefixed = self._apply_prefix(data)
         return expand_env_vars(prefixed, mode=resolved_expand)
 
+    def _load_content(self) -> tuple[JSONValue, bytes | None]:
+        """Return the loaded data and the file bytes it was parsed from, if kept."""
+        return self._load(), None
+
     def load_raw(self) -> LoadRawResult:
-        data = self._load()
+        data, loaded_bytes = self._load_content()
         processed = self._pre_processing(data, resolved_expand=self.expand_env_vars)  # type: ignore[arg-type]
         logger.debug(
             "[%s] load_raw: source=%s, raw_keys=%s, after_preprocessing_keys=%s",
@@ -144,7 +152,7 @@ class Source(abc.ABC):
             sorted(data.keys()) if isinstance(data, dict) else "<non-dict>",
             sorted(processed.keys()) if isinstance(processed, dict) else "<non-dict>",
         )
-        return LoadRawResult(data=processed)
+        return LoadRawResult(data=processed, loaded_bytes=loaded_bytes)
 
     @staticmethod
     def _empty_location(location_label: str, file_path: Path | None) -> SourceLocation:
@@ -272,6 +280,44 @@ class Source(abc.ABC):
         file_content: str | None,
         nested_conflict: NestedConflict | None,  # noqa: ARG002
         input_value: JSONValue = None,
+    ) -> list[SourceLocation]:
+        return self._resolve_file_location(
+            field_path=field_path,
+            file_content=FileContent(file_content) if file_content is not None else None,
+            input_value=input_value,
+        )
+
+    def _resolve_indexed_location(
+        self,
+        *,
+        field_path: list[str],
+        file_content: FileContent | None,
+        nested_conflict: NestedConflict | None,
+        input_value: JSONValue = None,
+    ) -> list[SourceLocation]:
+        """Resolve a location, reusing the line index of the load's ``FileContent``.
+
+        Sources that override ``resolve_location`` keep receiving the plain text.
+        """
+        if type(self).resolve_location is not Source.resolve_location:
+            return self.resolve_location(
+                field_path=field_path,
+                file_content=file_content.text if file_content is not None else None,
+                nested_conflict=nested_conflict,
+                input_value=input_value,
+            )
+        return self._resolve_file_location(
+            field_path=field_path,
+            file_content=file_content,
+            input_value=input_value,
+        )
+
+    def _resolve_file_location(
+        self,
+        *,
+        field_path: list[str],
+        file_content: FileContent | None,
+        input_value: JSONValue,
     ) -> list[SourceLocation]:
         file_path = self.file_path_for_errors()
         if file_content is None or not field_path:
@@ -281,19 +327,19 @@ class Source(abc.ABC):
             return [self._empty_location(self.location_label, file_path)]
 
         search_path = self._build_search_path(field_path, self.prefix)
-        finder = self.path_finder_class(file_content)
+        finder = file_content.path_finder(self.path_finder_class)
         line_range = finder.find_line_range(search_path)
         if line_range is None:
             line_range = self._find_parent_line_range(finder, search_path)
         if line_range is None:
             return [self._empty_location(self.location_label, file_path)]
 
-        lines = file_content.splitlines()
+        lines = file_content.lines
         content_lines: list[str] | None = None
         line_carets: list[CaretSpan] | None = None
         if 0 < line_range.start <= len(lines):
             end = min(line_range.end, len(lines))
-            raw = lines[line_range.start - 1 : end]
+            raw = list(lines[line_range.start - 1 : end])
             content_lines = self._strip_common_indent(raw)
             field_key = field_path[-1] if field_path else None
             line_carets = self._compute_line_carets(
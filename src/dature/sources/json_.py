@@ -1,7 +1,9 @@
 import json
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime, time
-from typing import cast
+from functools import cache
+from typing import Any, cast
 
 from adaptix import loader
 from adaptix.provider import Provider
@@ -17,6 +19,36 @@ from dature.path_finders.json_ import JsonPathFinder
 from dature.sources.base import FileSource
 from dature.types import FILE_LIKE_TYPES, FileOrStream, JSONValue
 
+# orjson silently turns integers outside the 64-bit range into floats; any run of 19+
+# digits might be one (int64 ends at -9223372036854775808), so such documents go
+# through the stdlib parser. Mapping every digit to "0" finds those runs with one
+# C-level translate and substring search, far cheaper than a regex over the document.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_WIDE_INTEGER_DIGITS = b"0" * 19
+
+
+@cache
+def _get_orjson_loads() -> Callable[[bytes | str], Any] | None:
+    try:
+        import orjson  # noqa: PLC0415
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+def _parse_json(content: bytes | str) -> JSONValue:
+    orjson_loads = _get_orjson_loads()
+    raw = content.encode() if isinstance(content, str) else content
+    if orjson_loads is not None and _WIDE_INTEGER_DIGITS not in raw.translate(_DIGITS_TO_ZERO):
+        try:
+            return cast("JSONValue", orjson_loads(raw))
+        except json.JSONDecodeError:
+            # orjson rejects some input the stdlib accepts (NaN/Infinity, a UTF-8 BOM);
+            # fall through so accepted input and error messages are the same with or
+            # without the extra installed.
+            pass
+    return cast("JSONValue", json.loads(content))
+
 
 @dataclass(kw_only=True, repr=False)
 class JsonSource(FileSource):
@@ -32,8 +64,16 @@ class JsonSource(FileSource):
             loader(bytearray, bytearray_from_string),
         ]
 
+    def _load_content(self) -> tuple[JSONValue, bytes | None]:
+        # The parsed bytes go to the load's error context, so error snippets do not
+        # read the file a second time.
+        path = self._resolved_file_path
+        if path is None:
+            return self._load(), None
+        loaded_bytes = path.read_bytes()
+        return _parse_json(loaded_bytes), loaded_bytes
+
     def _load_file(self, path: FileOrStream) -> JSONValue:
         if isinstance(path, FILE_LIKE_TYPES):
-            return cast("JSONValue", json.load(path))
-        with path.open() as file:
-            return cast("JSONValue", json.load(file))
+            return _parse_json(path.read())
+        return _parse_json(path.read_bytes())
@@ -1,5 +1,6 @@
 from dataclasses import fields
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast, get_type_hints
 
 from adaptix import NameStyle as AdaptixNameStyle
@@ -122,7 +123,13 @@ def get_name_mapping_providers(
     return providers
 
 
-def get_validator_providers[T](schema: type[T]) -> list[Provider]:
+@lru_cache(maxsize=128)
+def get_validator_providers(schema: type) -> tuple[Provider, ...]:
+    """Collect the field validator providers of ``schema`` and its nested dataclasses.
+
+    The result depends only on the class, so it is cached for recently used schemas and
+    reused by every validating retort built for them.
+    """
     providers: list[Provider] = []
     type_hints = get_type_hints(schema, include_extras=True)
 
@@ -138,10 +145,9 @@ def get_validator_providers[T](schema: type[T]) -> list[Provider]:
             providers.extend(field_providers)
 
         for nested_dc in find_nested_dataclasses(field_type):
-            nested_providers = get_validator_providers(nested_dc)
-            providers.extend(nested_providers)
+            providers.extend(get_validator_providers(nested_dc))
 
-    return providers
+    return tuple(providers)
 
 
 def build_base_recipe(
@@ -199,6 +205,44 @@ def create_probe_retort(
     )
 
 
+_PROBE_RETORT_CACHE_SIZE = 128
+_probe_retort_cache: "dict[tuple[Any, ...], Retort]" = {}
+
+
+def get_probe_retort(
+    source: "Source",
+    schema: "type[DataclassInstance]",
+    *,
+    resolved_type_loaders: "TypeLoaderMap | None" = None,
+) -> Retort:
+    """Return a probe retort with the loader for ``schema`` already compiled.
+
+    The probe recipe depends only on the source class, its name style, field mapping and
+    type loaders, so sources configured alike share one retort across ``load()`` calls.
+    The cache keeps the most recently used retorts; sources with an unhashable setup get
+    a fresh retort.
+    """
+    type_loaders = resolved_type_loaders or source.type_loaders or {}
+    try:
+        cache_key = (
+            type(source),
+            schema,
+            source.name_style,
+            frozenset((source.field_mapping or {}).items()),
+            frozenset(type_loaders.items()),
+        )
+        probe_retort = _probe_retort_cache.pop(cache_key, None)
+    except TypeError:
+        return create_probe_retort(source, resolved_type_loaders=resolved_type_loaders)
+    if probe_retort is None:
+        probe_retort = create_probe_retort(source, resolved_type_loaders=resolved_type_loaders)
+        probe_retort.get_loader(schema)
+        if len(_probe_retort_cache) >= _PROBE_RETORT_CACHE_SIZE:
+            _probe_retort_cache.pop(next(iter(_probe_retort_cache)), None)
+    _probe_retort_cache[cache_key] = probe_retort
+    return probe_retort
+
+
 def create_validating_retort[T](
     source: "Source",
     schema: type[T],
@@ -215,7 +259,7 @@ def create_validating_retort[T](
     return Retort(
         strict_coercion=True,
         recipe=[
-            *get_validator_providers(schema),
+            *get_validator_providers(cast("type", schema)),
             *metadata_validator_providers,
             *root_validator_providers,
             *build_base_recipe(source, resolved_type_loaders=resolved_type_loaders),
@@ -254,3 +298,51 @@ def ensure_retort(
     if key not in source.retorts:
         source.retorts[key] = create_retort(source, resolved_type_loaders=resolved_type_loaders)
     source.retorts[key].get_loader(cls)
+
+
+_VALIDATING_RETORT_CACHE_SIZE = 128
+_validating_retort_cache: "dict[tuple[Any, ...], tuple[Retort, tuple[Any, ...]]]" = {}
+
+
+def get_validating_retort[T](
+    source: "Source",
+    schema: type[T],
+    *,
+    resolved_type_loaders: "TypeLoaderMap | None" = None,
+) -> Retort:
+    """Return a validating retort with the loader for ``schema`` already compiled.
+
+    Besides what the probe recipe depends on, the validating recipe includes the source's
+    ``validators`` and ``root_validators``. They join the cache key by identity: predicates
+    such as ``V > 1`` and ``V > 1.0`` compare equal but report different messages. The
+    cache keeps the most recently used retorts; sources with an unhashable setup or
+    one-shot ``root_validators`` get a fresh retort.
+    """
+    root_validators = source.root_validators or ()
+    if not isinstance(root_validators, (tuple, list)):
+        return create_validating_retort(source, schema, resolved_type_loaders=resolved_type_loaders)
+
+    type_loaders = resolved_type_loaders or source.type_loaders or {}
+    validators = tuple((source.validators or {}).items())
+    try:
+        cache_key = (
+            type(source),
+            schema,
+            source.name_style,
+            frozenset((source.field_mapping or {}).items()),
+            frozenset(type_loaders.items()),
+            tuple((path, id(value)) for path, value in validators),
+            tuple(id(predicate) for predicate in root_validators),
+        )
+        cached = _validating_retort_cache.pop(cache_key, None)
+    except TypeError:
+        return create_validating_retort(source, schema, resolved_type_loaders=resolved_type_loaders)
+    if cached is None:
+        validating_retort = create_validating_retort(source, schema, resolved_type_loaders=resolved_type_loaders)
+        validating_retort.get_loader(schema)
+        # The entry holds the predicates so their ids stay unique while it is cached.
+        cached = (validating_retort, (validators, tuple(root_validators)))
+        if len(_validating_retort_cache) >= _VALIDATING_RETORT_CACHE_SIZE:
+            _validating_retort_cache.pop(next(iter(_validating_retort_cache)), None)
+    _validating_retort_cache[cache_key] = cached
+    return cached[0]
@@ -32,16 +32,22 @@ def _deduplicate(items: list[JSONValue]) -> list[JSONValue]:
 
 
 class FieldFirstWins:
+    __slots__ = ()
+
     def __call__(self, values: list[JSONValue]) -> JSONValue:
         return values[0]
 
 
 class FieldLastWins:
+    __slots__ = ()
+
     def __call__(self, values: list[JSONValue]) -> JSONValue:
         return values[-1]
 
 
 class FieldAppend:
+    __slots__ = ()
+
     def __call__(self, values: list[JSONValue]) -> list[JSONValue]:
         result: list[JSONValue] = []
         for chunk in _ensure_all_lists(values, "APPEND"):
@@ -50,6 +56,8 @@ class FieldAppend:
 
 
 class FieldAppendUnique:
+    __slots__ = ()
+
     def __call__(self, values: list[JSONValue]) -> list[JSONValue]:
         result: list[JSONValue] = []
         for chunk in _ensure_all_lists(values, "APPEND_UNIQUE"):
@@ -58,6 +66,8 @@ class FieldAppendUnique:
 
 
 class FieldPrepend:
+    __slots__ = ()
+
     def __call__(self, values: list[JSONValue]) -> list[JSONValue]:
         result: list[JSONValue] = []
         for chunk in reversed(_ensure_all_lists(values, "PREPEND")):
@@ -66,6 +76,8 @@ class FieldPrepend:
 
 
 class FieldPrependUnique:
+    __slots__ = ()
+
     def __call__(self, values: list[JSONValue]) -> list[JSONValue]:
         result: list[JSONValue] = []
         for chunk in reversed(_ensure_all_lists(values, "PREPEND_UNIQUE")):
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from dature.errors import DatureConfigError, SourceLoadError, SourceLocation
 from dature.errors.formatter import handle_load_errors
-from dature.errors.location import read_file_content
 from dature.load_report import FieldOrigin, SourceEntry
 from dature.loading.context import build_error_ctx
 from dature.loading.source_loading import (
@@ -259,16 +258,17 @@ class LoadCtx:
             return None
 
         raw = load_result.data
-        if load_result.nested_conflicts:
+        if load_result.nested_conflicts or load_result.loaded_bytes is not None:
             error_ctx = build_error_ctx(
                 source,
                 self.dataclass_name,
                 secret_paths=self._secret_paths,
                 mask_secrets=self._mask_secrets,
                 nested_conflicts=load_result.nested_conflicts,
+                loaded_bytes=load_result.loaded_bytes,
             )
 
-        file_content = read_file_content(error_ctx.source.file_path_for_errors())
+        source_ctx = SourceContext(error_ctx=error_ctx)
 
         filter_result = apply_merge_skip_invalid(
             raw=raw,
@@ -280,7 +280,7 @@ class LoadCtx:
 
         for path in filter_result.skipped_paths:
             self._skipped_fields.setdefault(path, []).append(
-                SkippedFieldSource(source=source, error_ctx=error_ctx, file_content=file_content),
+                SkippedFieldSource(source=source, error_ctx=error_ctx, file_content=source_ctx.file_content),
             )
 
         raw = filter_result.cleaned_dict
@@ -317,7 +317,7 @@ class LoadCtx:
                 raw_data=raw,
             ),
         )
-        self._source_ctxs.append(SourceContext(error_ctx=error_ctx, file_content=file_content))
+        self._source_ctxs.append(source_ctx)
         self._raw_dicts.append(raw)
         self._last_source = source
         self._last_type_loaders = type_loaders
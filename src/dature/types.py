@@ -108,3 +108,4 @@ type NestedConflicts = dict[str, NestedConflict]
 class LoadRawResult:
     data: JSONValue
     nested_conflicts: NestedConflicts = field(default_factory=dict)
+    loaded_bytes: bytes | None = None
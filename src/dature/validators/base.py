@@ -1,8 +1,8 @@
-from collections.abc import Iterable, Mapping
-from typing import TYPE_CHECKING, Annotated, Any, cast, get_args, get_origin, get_type_hints
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Annotated, Any, TypeGuard, cast, get_args, get_origin, get_type_hints
 
 from adaptix import P, validator
-from adaptix.load_error import AggregateLoadError, ValidationLoadError
+from adaptix.load_error import AggregateLoadError, LoadError, ValidationLoadError
 from adaptix.provider import Provider
 from adaptix.struct_trail import append_trail
 
@@ -10,6 +10,7 @@ from dature.expansion.alias_provider import resolve_nested_owner
 from dature.field_path import FieldPath
 from dature.types import FieldValidators
 from dature.validators.collection import EachPredicate
+from dature.validators.compare import LengthComparePredicate
 from dature.validators.predicate import AndPredicate, Predicate
 from dature.validators.root import RootPredicate
 
@@ -20,9 +21,9 @@ if TYPE_CHECKING:
 def _flatten(predicate: Predicate) -> list[Predicate]:
     """Flatten AndPredicate trees into a flat list of leaf predicates.
 
-    ``A & B & C`` produces three independent providers, matching adaptix behaviour
+    ``A & B & C`` produces three independent checks, matching adaptix behaviour
     where multiple validators on the same field must all pass. ``Or`` / ``Not`` /
-    leaves stay as single providers.
+    leaves stay as single checks.
     """
     if isinstance(predicate, AndPredicate):
         return _flatten(predicate.left) + _flatten(predicate.right)
@@ -50,7 +51,11 @@ def extract_and_check_validators(
     return predicates
 
 
-def _make_each_provider(location: Any, each: EachPredicate) -> Provider:  # noqa: ANN401
+# A validator's check and the factory for the error it raises when the check fails.
+_Check = tuple[Callable[[Any], bool], Callable[[Any], LoadError]]
+
+
+def _each_check(each: EachPredicate) -> _Check:
     inner_func = each.inner.get_validator_func()
     inner_msg = each.inner.get_error_message()
 
@@ -66,26 +71,101 @@ def _make_each_provider(location: Any, each: EachPredicate) -> Provider:  # noqa
                 sub_errors.append(sub)
         return AggregateLoadError(each.get_error_message(), tuple(sub_errors))
 
-    return validator(location, all_pass, build_error)
+    return all_pass, build_error
 
 
-def _make_provider(location: Any, predicate: Predicate) -> Provider:  # noqa: ANN401
+def _predicate_check(predicate: Predicate) -> _Check:
     if isinstance(predicate, EachPredicate):
-        return _make_each_provider(location, predicate)
-    return validator(
-        location,
-        predicate.get_validator_func(),
-        predicate.get_error_message(),
+        return _each_check(predicate)
+    message = predicate.get_error_message()
+    return predicate.get_validator_func(), lambda val: ValidationLoadError(message, val)
+
+
+# Offsets that turn ``V.len()`` bounds into an inclusive integer range.
+_LOWER_BOUND_OFFSETS = {"ge": 0, "gt": 1}
+_UPPER_BOUND_OFFSETS = {"le": 0, "lt": -1}
+
+
+def _is_length_bound(predicate: Predicate) -> TypeGuard[LengthComparePredicate]:
+    return (
+        isinstance(predicate, LengthComparePredicate)
+        and predicate.op in _LOWER_BOUND_OFFSETS.keys() | _UPPER_BOUND_OFFSETS.keys()
+        and type(predicate.value) is int
     )
 
 
+def _length_checks(bounds: list[LengthComparePredicate]) -> list[_Check]:
+    """Check consecutive ``V.len()`` bounds as one inclusive range with a single ``len()`` call.
+
+    Separate validators report the last failing bound, so the fused error does too.
+    """
+    if len(bounds) <= 1:
+        return [_predicate_check(bound) for bound in bounds]
+
+    lower = max(
+        (bound.value + _LOWER_BOUND_OFFSETS[bound.op] for bound in bounds if bound.op in _LOWER_BOUND_OFFSETS),
+        default=0,
+    )
+    uppers = [bound.value + _UPPER_BOUND_OFFSETS[bound.op] for bound in bounds if bound.op in _UPPER_BOUND_OFFSETS]
+    checks = [(bound.get_length_check(), bound.get_error_message()) for bound in bounds]
+
+    def build_error(val: Any) -> ValidationLoadError:  # noqa: ANN401
+        length = len(val)
+        message = next(message for check, message in reversed(checks) if not check(length))
+        return ValidationLoadError(message, val)
+
+    if not uppers:
+        return [(lambda v: len(v) >= lower, build_error)]
+    upper = min(uppers)
+    return [(lambda v: lower <= len(v) <= upper, build_error)]
+
+
+def _compile_checks(checks: list[_Check]) -> _Check:
+    """Fold a field's checks into one validator function and its error builder.
+
+    adaptix runs chained validators from the last one registered and stops at the first
+    failure, so the fused function runs the checks in reverse order and the error comes
+    from the first of them that fails — the same outcome as one validator per check.
+    """
+    if len(checks) == 1:
+        return checks[0]
+
+    ordered = tuple(reversed(checks))
+    funcs = tuple(func for func, _ in ordered)
+
+    def fused_check(val: Any) -> bool:  # noqa: ANN401
+        return all(func(val) for func in funcs)
+
+    def build_error(val: Any) -> LoadError:  # noqa: ANN401
+        for func, error in ordered:
+            if not func(val):
+                return error(val)
+        # A non-deterministic ``V.check`` callable can pass when it is re-run here.
+        return ordered[0][1](val)
+
+    return fused_check, build_error
+
+
 def create_validator_providers(
     schema: type,
     field_name: str,
     predicates: list[Predicate],
 ) -> list[Provider]:
-    location = P[schema][field_name]
-    return [_make_provider(location, p) for p in predicates]
+    checks: list[_Check] = []
+    bounds: list[LengthComparePredicate] = []
+    for predicate in predicates:
+        if _is_length_bound(predicate):
+            bounds.append(predicate)
+            continue
+        checks.extend(_length_checks(bounds))
+        bounds = []
+        checks.append(_predicate_check(predicate))
+    checks.extend(_length_checks(bounds))
+    if not checks:
+        return []
+
+    func, build_error = _compile_checks(checks)
+    return [validator(P[schema][field_name], func, build_error)]
 
 
 def _normalize_metadata_value(
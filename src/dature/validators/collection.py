@@ -25,8 +25,7 @@ class InPredicate(Predicate):
         return
 
     def get_validator_func(self) -> Callable[[Any], bool]:
-        values = self.values
-        return lambda v: v in values
+        return self.values.__contains__
 
     def get_error_message(self) -> str:
         if self.error_message is not None:
@@ -35,6 +34,13 @@ class InPredicate(Predicate):
         return f"Value must be one of: {rendered}"
 
 
+def _has_unique_items(val: Any) -> bool:  # noqa: ANN401
+    # Sets cannot hold duplicates, so there is nothing to hash again.
+    if isinstance(val, (set, frozenset)):
+        return True
+    return len(val) == len(set(val))
+
+
 @final
 @dataclass(frozen=True, slots=True)
 class UniqueItemsPredicate(Predicate):
@@ -52,10 +58,7 @@ class UniqueItemsPredicate(Predicate):
             raise ValidatorTypeError(field_path=field_path, message=msg)
 
     def get_validator_func(self) -> Callable[[Any], bool]:
-        def validate(val: Any) -> bool:  # noqa: ANN401
-            return len(val) == len(set(val))
-
-        return validate
+        return _has_unique_items
 
     def get_error_message(self) -> str:
         if self.error_message is not None:
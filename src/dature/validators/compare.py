@@ -31,6 +31,27 @@ _LENGTH_TEMPLATES: dict[CompareOp, str] = {
 }
 
 
+# Each factory closes over the threshold, so a validator is a single comparison per value.
+_COMPARE_FACTORIES: dict[CompareOp, Callable[[Any], Callable[[Any], bool]]] = {
+    "gt": lambda value: lambda v: v > value,
+    "ge": lambda value: lambda v: v >= value,
+    "lt": lambda value: lambda v: v < value,
+    "le": lambda value: lambda v: v <= value,
+    "eq": lambda value: lambda v: v == value,
+    "ne": lambda value: lambda v: v != value,
+}
+
+
+_LENGTH_FACTORIES: dict[CompareOp, Callable[[int], Callable[[Any], bool]]] = {
+    "gt": lambda value: lambda v: len(v) > value,
+    "ge": lambda value: lambda v: len(v) >= value,
+    "lt": lambda value: lambda v: len(v) < value,
+    "le": lambda value: lambda v: len(v) <= value,
+    "eq": lambda value: lambda v: len(v) == value,
+    "ne": lambda value: lambda v: len(v) != value,
+}
+
+
 @final
 @dataclass(frozen=True, slots=True)
 class ComparePredicate(Predicate):
@@ -45,19 +66,7 @@ class ComparePredicate(Predicate):
         return
 
     def get_validator_func(self) -> Callable[[Any], bool]:
-        op = self.op
-        value = self.value
-        if op == "gt":
-            return lambda v: v > value
-        if op == "ge":
-            return lambda v: v >= value
-        if op == "lt":
-            return lambda v: v < value
-        if op == "le":
-            return lambda v: v <= value
-        if op == "eq":
-            return lambda v: v == value
-        return lambda v: v != value
+        return _COMPARE_FACTORIES[self.op](self.value)
 
     def get_error_message(self) -> str:
         if self.error_message is not None:
@@ -83,19 +92,11 @@ class LengthComparePredicate(Predicate):
             raise ValidatorTypeError(field_path=field_path, message=msg)
 
     def get_validator_func(self) -> Callable[[Any], bool]:
-        op = self.op
-        value = self.value
-        if op == "gt":
-            return lambda v: len(v) > value
-        if op == "ge":
-            return lambda v: len(v) >= value
-        if op == "lt":
-            return lambda v: len(v) < value
-        if op == "le":
-            return lambda v: len(v) <= value
-        if op == "eq":
-            return lambda v: len(v) == value
-        return lambda v: len(v) != value
+        return _LENGTH_FACTORIES[self.op](self.value)
+
+    def get_length_check(self) -> Callable[[int], bool]:
+        """Return the bound check applied to an already computed length."""
+        return _COMPARE_FACTORIES[self.op](self.value)
 
     def get_error_message(self) -> str:
         if self.error_message is not None:
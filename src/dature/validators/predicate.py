@@ -16,6 +16,9 @@ from typing import Any, final
 class Predicate(abc.ABC):
     """Base class for all V-predicates. Subclasses must be frozen dataclasses."""
 
+    # Without this every subclass instance keeps a ``__dict__`` despite ``slots=True``.
+    __slots__ = ()
+
     @abc.abstractmethod
     def check_type(self, field_type: Any, *, field_path: list[str]) -> None:  # noqa: ANN401
         """Raise ``ValidatorTypeError`` if this predicate cannot be applied to ``field_type``."""
@@ -3,18 +3,53 @@
 import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any, final
+from functools import lru_cache
+from typing import Any, Literal, Protocol, cast, final
 
 from dature.errors.exceptions import ValidatorTypeError
 from dature.validators.predicate import Predicate
 from dature.validators.type_compat import format_type, is_str_type
 
+# A pattern that is only an optional ``^``, plain word characters, spaces or hyphens and an
+# optional trailing ``.*`` matches exactly the strings starting with that literal.
+_LITERAL_PREFIX_RE = re.compile(r"\^?([\w -]*)(?:\.\*)?")
+
+
+RegexEngine = Literal["re", "re2"]
+
+
+class _CompiledPattern(Protocol):
+    def match(self, string: str, /) -> object: ...
+
+
+# Schemas often repeat a pattern; ``re2.compile`` has no cache of its own, and sharing the
+# compiled object also skips ``re``'s per-call cache lookup.
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str, engine: RegexEngine) -> _CompiledPattern:
+    if engine == "re2":
+        import re2  # noqa: PLC0415
+
+        try:
+            return cast("_CompiledPattern", re2.compile(pattern))
+        except re2.error as exc:
+            msg = (
+                f"V.matches({pattern!r}, engine='re2'): RE2 cannot compile this pattern ({exc}); "
+                "backreferences and lookarounds need engine='re'"
+            )
+            raise ValueError(msg) from exc
+    return re.compile(pattern)
+
 
 @final
 @dataclass(frozen=True, slots=True)
 class MatchesPredicate(Predicate):
     pattern: str
     error_message: str | None = field(default=None, kw_only=True)
+    engine: RegexEngine = field(default="re", kw_only=True)
+    _compiled: _CompiledPattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_compiled", _compile_pattern(self.pattern, self.engine))
 
     def check_type(self, field_type: Any, *, field_path: list[str]) -> None:  # noqa: ANN401
         if not is_str_type(field_type):
@@ -26,8 +61,11 @@ class MatchesPredicate(Predicate):
             raise ValidatorTypeError(field_path=field_path, message=msg)
 
     def get_validator_func(self) -> Callable[[Any], bool]:
-        compiled = re.compile(self.pattern)
-        return lambda v: bool(compiled.match(v))
+        if literal := _LITERAL_PREFIX_RE.fullmatch(self.pattern):
+            prefix = literal.group(1)
+            return lambda v: v.startswith(prefix)
+        match = self._compiled.match
+        return lambda v: match(v) is not None
 
     def get_error_message(self) -> str:
         if self.error_message is not None:
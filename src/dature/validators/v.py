@@ -37,7 +37,7 @@ from dature.validators.compare import ComparePredicate, LengthComparePredicate
 from dature.validators.custom import CustomPredicate
 from dature.validators.predicate import Predicate
 from dature.validators.root import RootPredicate
-from dature.validators.text import MatchesPredicate
+from dature.validators.text import MatchesPredicate, RegexEngine
 
 
 def _reject_dsl_value(value: Any, context: str) -> None:  # noqa: ANN401
@@ -117,8 +117,14 @@ class _V:
     def in_(self, values: Iterable[Any], *, error_message: str | None = None) -> InPredicate:
         return InPredicate(tuple(values), error_message=error_message)
 
-    def matches(self, pattern: str, *, error_message: str | None = None) -> MatchesPredicate:
-        return MatchesPredicate(pattern, error_message=error_message)
+    def matches(
+        self,
+        pattern: str,
+        *,
+        error_message: str | None = None,
+        engine: RegexEngine = "re",
+    ) -> MatchesPredicate:
+        return MatchesPredicate(pattern, error_message=error_message, engine=engine)
 
     def unique_items(self, *, error_message: str | None = None) -> UniqueItemsPredicate:
         return UniqueItemsPredicate(error_message=error_message)
@@ -1,6 +1,9 @@
+import pytest
+
 from dature import EnvFileSource, EnvSource, JsonSource, Toml11Source
 from dature.errors import LineRange
-from dature.errors.location import ErrorContext, resolve_source_location
+from dature.errors.location import ErrorContext, FileContent, resolve_source_location
+from dature.path_finders.json_ import JsonPathFinder
 
 
 class TestResolveSourceLocation:
@@ -64,7 +67,7 @@ class TestResolveSourceLocation:
             dataclass_name="Config",
             source=JsonSource(file="config.json"),
         )
-        locs = resolve_source_location(["timeout"], ctx, file_content=content)
+        locs = resolve_source_location(["timeout"], ctx, file_content=FileContent(content))
         assert locs[0].location_label == "FILE"
         assert locs[0].line_range == LineRange(start=2, end=2)
         assert locs[0].line_content == ['"timeout": "30",']
@@ -75,7 +78,7 @@ class TestResolveSourceLocation:
             dataclass_name="Config",
             source=Toml11Source(file="config.toml"),
         )
-        locs = resolve_source_location(["timeout"], ctx, file_content=content)
+        locs = resolve_source_location(["timeout"], ctx, file_content=FileContent(content))
         assert locs[0].location_label == "FILE"
         assert locs[0].line_range == LineRange(start=1, end=1)
         assert locs[0].line_content == ['timeout = "30"']
@@ -86,7 +89,7 @@ class TestResolveSourceLocation:
             dataclass_name="Config",
             source=EnvFileSource(file="dummy.env", prefix="APP_"),
         )
-        locs = resolve_source_location(["timeout"], ctx, file_content=content)
+        locs = resolve_source_location(["timeout"], ctx, file_content=FileContent(content))
         assert locs[0].location_label == "ENV FILE"
         assert locs[0].env_var_name == "APP_TIMEOUT"
         assert locs[0].line_range == LineRange(start=2, end=2)
@@ -99,7 +102,7 @@ class TestResolveSourceLocation:
             source=JsonSource(file="config.json"),
             secret_paths=frozenset({"password"}),
         )
-        locs = resolve_source_location(["timeout"], ctx, file_content=content)
+        locs = resolve_source_location(["timeout"], ctx, file_content=FileContent(content))
         assert locs[0].line_content == ['"timeout": "30"']
 
     def test_filesource_masks_secret_field(self):
@@ -109,7 +112,7 @@ class TestResolveSourceLocation:
             source=JsonSource(file="config.json"),
             secret_paths=frozenset({"password"}),
         )
-        locs = resolve_source_location(["password"], ctx, file_content=content)
+        locs = resolve_source_location(["password"], ctx, file_content=FileContent(content))
         assert locs[0].line_content == ['"password": "<REDACTED>",']
 
     def test_filesource_masks_line_when_secret_on_same_line(self):
@@ -119,5 +122,30 @@ class TestResolveSourceLocation:
             source=JsonSource(file="config.json"),
             secret_paths=frozenset({"password"}),
         )
-        locs = resolve_source_location(["timeout"], ctx, file_content=content)
+        locs = resolve_source_location(["timeout"], ctx, file_content=FileContent(content))
         assert locs[0].line_content == ['{"password": "<REDACTED>", "timeout": "30"}']
+
+    def test_file_indexed_once_per_file_content(self, monkeypatch: pytest.MonkeyPatch):
+        content = '{\n  "indexed_once_a": "x",\n  "indexed_once_b": "y"\n}'
+        ctx = ErrorContext(
+            dataclass_name="Config",
+            source=JsonSource(file="config.json"),
+        )
+        init_calls: list[str] = []
+        original_init = JsonPathFinder.__init__
+
+        def counting_init(self: JsonPathFinder, file_content: str) -> None:
+            init_calls.append(file_content)
+            original_init(self, file_content)
+
+        monkeypatch.setattr(JsonPathFinder, "__init__", counting_init)
+
+        file_content = FileContent(content)
+
+        first = resolve_source_location(["indexed_once_a"], ctx, file_content=file_content)
+        second = resolve_source_location(["indexed_once_b"], ctx, file_content=file_content)
+        resolve_source_location(["indexed_once_a"], ctx, file_content=FileContent(content))
+
+        assert init_calls == [content, content]
+        assert first[0].line_range == LineRange(start=2, end=2)
+        assert second[0].line_content == ['"indexed_once_b": "y"']
@@ -94,6 +94,11 @@ class TestExpandFilePath:
 
         assert result == "$HOME/config.toml"
 
+    def test_path_without_vars_returned_as_is(self) -> None:
+        file_path = Path("/etc/app/config.toml")
+
+        assert expand_file_path(file_path, mode="strict") is file_path
+
 
 class TestSourceFileExpansion:
     @pytest.mark.parametrize(
@@ -103,7 +108,7 @@ class TestSourceFileExpansion:
             (
                 Path("$DATURE_DIR") / "config.toml",
                 {"DATURE_DIR": "/etc/app"},
-                str(Path("/etc/app") / "config.toml"),
+                Path("/etc/app") / "config.toml",
             ),
             (
                 "config.$DATURE_ENV.toml",
@@ -119,7 +124,7 @@ class TestSourceFileExpansion:
             (
                 Path("$DATURE_DIR") / "config.$DATURE_ENV.toml",
                 {"DATURE_DIR": "/etc/app", "DATURE_ENV": "prod"},
-                str(Path("/etc/app") / "config.prod.toml"),
+                Path("/etc/app") / "config.prod.toml",
             ),
         ],
         ids=["str-dir", "path-dir", "str-filename-env", "no-vars", "str-windows-percent", "path-dir-and-filename"],
@@ -129,7 +134,7 @@ class TestSourceFileExpansion:
         monkeypatch: pytest.MonkeyPatch,
         file: str | Path,
         env_vars: dict[str, str],
-        expected: str,
+        expected: str | Path,
     ) -> None:
         for key in ("DATURE_DIR", "DATURE_ENV"):
             monkeypatch.delenv(key, raising=False)
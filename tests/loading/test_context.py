@@ -1,21 +1,25 @@
 """Tests for loading/context.py."""
 
-from dataclasses import dataclass, fields
+import logging
+from dataclasses import dataclass, fields, make_dataclass
 from enum import Flag
 from pathlib import Path
-from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
 from dature.field_path import FieldPath
 from dature.loading.context import (
+    _allowed_field_paths,
+    _flag_field_names,
     apply_skip_invalid,
     build_error_ctx,
     coerce_flag_fields,
     get_allowed_fields,
-    make_validating_post_init,
+    make_fields_reader,
+    make_guarded_post_init,
     merge_fields,
+    validate_patched_instance,
 )
 from dature.sources.env_ import EnvSource
 from dature.sources.json_ import JsonSource
@@ -35,13 +39,13 @@ class TestMergeFields:
         port: int = 8080
         debug: bool = True
 
-    def _field_list(self) -> tuple[Any, ...]:
-        return fields(self.Config)
+    def _field_names(self) -> tuple[str, ...]:
+        return tuple(f.name for f in fields(self.Config))
 
     def test_no_explicit_fields(self):
         loaded = self.Loaded()
 
-        result = merge_fields(loaded, self._field_list(), (), {})
+        result = merge_fields(loaded, self._field_names(), (), {})
 
         assert result == {"name": "loaded_name", "port": 8080, "debug": True}
 
@@ -49,21 +53,28 @@ class TestMergeFields:
         loaded = self.Loaded()
         kwargs = {"name": "explicit", "port": 9090, "debug": False}
 
-        result = merge_fields(loaded, self._field_list(), (), kwargs)
+        result = merge_fields(loaded, self._field_names(), (), kwargs)
 
         assert result == {"name": "explicit", "port": 9090, "debug": False}
 
+    def test_fully_explicit_does_not_read_loaded(self):
+        kwargs = {"port": 9090, "debug": False}
+
+        result = merge_fields(object(), self._field_names(), ("positional_name",), kwargs)
+
+        assert result == {"port": 9090, "debug": False}
+
     def test_partial_kwargs(self):
         loaded = self.Loaded()
 
-        result = merge_fields(loaded, self._field_list(), (), {"name": "explicit"})
+        result = merge_fields(loaded, self._field_names(), (), {"name": "explicit"})
 
         assert result == {"name": "explicit", "port": 8080, "debug": True}
 
     def test_positional_args(self):
         loaded = self.Loaded()
 
-        result = merge_fields(loaded, self._field_list(), ("positional_name",), {})
+        result = merge_fields(loaded, self._field_names(), ("positional_name",), {})
 
         assert result == {"port": 8080, "debug": True}
 
@@ -72,7 +83,7 @@ class TestMergeFields:
 
         result = merge_fields(
             loaded,
-            self._field_list(),
+            self._field_names(),
             ("positional_name",),
             {"debug": False},
         )
@@ -84,7 +95,7 @@ class TestMergeFields:
 
         result = merge_fields(
             loaded,
-            self._field_list(),
+            self._field_names(),
             ("a", "b", "c", "extra"),
             {},
         )
@@ -92,6 +103,31 @@ class TestMergeFields:
         assert result == {}
 
 
+class TestMakeFieldsReader:
+    @dataclass
+    class Loaded:
+        name: str = "loaded_name"
+        port: int = 8080
+        debug: bool = True
+
+    @pytest.mark.parametrize(
+        ("field_names", "expected"),
+        [
+            pytest.param((), {}, id="no_fields"),
+            pytest.param(("port",), {"port": 8080}, id="single_field"),
+            pytest.param(
+                ("name", "port", "debug"),
+                {"name": "loaded_name", "port": 8080, "debug": True},
+                id="many_fields",
+            ),
+        ],
+    )
+    def test_reads_all_fields(self, field_names: tuple[str, ...], expected: dict[str, object]):
+        read_fields = make_fields_reader(field_names)
+
+        assert read_fields(self.Loaded()) == expected
+
+
 class TestCoerceFlagFields:
     class Permission(Flag):
         READ = 1
@@ -117,6 +153,15 @@ class TestCoerceFlagFields:
 
         assert result == {"name": "test", "perms": 3}
 
+    def test_schema_without_flags_returns_data(self):
+        @dataclass
+        class Plain:
+            name: str
+
+        data = {"name": "test"}
+
+        assert coerce_flag_fields(data, Plain) is data
+
     def test_non_flag_string_fields_unchanged(self):
         data = {"name": "hello", "perms": "5"}
 
@@ -143,6 +188,15 @@ class TestCoerceFlagFields:
 
         assert result == {"name": "test"}
 
+    def test_flag_names_cache_is_bounded(self):
+        maxsize = _flag_field_names.cache_info().maxsize
+        assert maxsize is not None
+
+        for idx in range(maxsize + 1):
+            coerce_flag_fields({"name": "test"}, make_dataclass(f"Cfg{idx}", [("name", str)]))
+
+        assert _flag_field_names.cache_info().currsize == maxsize
+
     def test_non_numeric_string_left_unchanged(self):
         data = {"name": "test", "perms": "READ|WRITE"}
 
@@ -192,7 +246,43 @@ class TestGetAllowedFields:
 
         result = get_allowed_fields(skip_value=(fp,), schema=Cfg)
 
-        assert result == {"name"}
+        assert result == frozenset({"name"})
+
+    def test_resolved_once_per_schema(self):
+        @dataclass
+        class Cfg:
+            name: str
+
+        skip_value = (FieldPath(owner=Cfg, parts=("name",)),)
+
+        first = get_allowed_fields(skip_value=skip_value, schema=Cfg)
+
+        assert get_allowed_fields(skip_value=skip_value, schema=Cfg) is first
+
+    def test_owner_mismatch_raises_every_time(self):
+        @dataclass
+        class Cfg:
+            name: str
+
+        @dataclass
+        class Other:
+            name: str
+
+        skip_value = (FieldPath(owner=Other, parts=("name",)),)
+
+        for _ in range(2):
+            with pytest.raises(TypeError, match="does not match target dataclass 'Cfg'"):
+                get_allowed_fields(skip_value=skip_value, schema=Cfg)
+
+    def test_cache_is_bounded(self):
+        maxsize = _allowed_field_paths.cache_info().maxsize
+        assert maxsize is not None
+
+        for idx in range(maxsize + 1):
+            schema = make_dataclass(f"Cfg{idx}", [("name", str)])
+            get_allowed_fields(skip_value=(FieldPath(owner=schema, parts=("name",)),), schema=schema)
+
+        assert _allowed_field_paths.cache_info().currsize == maxsize
 
 
 class TestApplySkipInvalid:
@@ -213,12 +303,44 @@ class TestApplySkipInvalid:
             skip_field_if_invalid=skip_field_if_invalid,
             source=source,
             schema=Cfg,
-            log_prefix="[test]",
         )
 
         assert result.cleaned_dict == raw
         assert result.skipped_paths == []
 
+    @pytest.mark.parametrize(
+        ("source_index", "expected_message"),
+        [
+            pytest.param(None, "[Cfg] Skipped invalid field 'port'", id="single_source"),
+            pytest.param(2, "[Cfg] Source 2: Skipped invalid field 'port'", id="merge_source"),
+        ],
+    )
+    def test_logs_skipped_fields(
+        self,
+        tmp_path: Path,
+        caplog: pytest.LogCaptureFixture,
+        source_index: int | None,
+        expected_message: str,
+    ):
+        json_file = tmp_path / "config.json"
+        json_file.write_text("{}")
+
+        @dataclass
+        class Cfg:
+            name: str
+            port: int = 8080
+
+        with caplog.at_level(logging.WARNING, logger="dature"):
+            apply_skip_invalid(
+                raw={"name": "hello", "port": "abc"},
+                skip_field_if_invalid=True,
+                source=JsonSource(file=json_file),
+                schema=Cfg,
+                source_index=source_index,
+            )
+
+        assert [r.getMessage() for r in caplog.records] == [expected_message]
+
 
 class TestEnsureRetort:
     def test_creates_and_caches_retort(self, tmp_path: Path):
@@ -241,47 +363,50 @@ class TestEnsureRetort:
         assert source.retorts[key] is first
 
 
-class TestMakeValidatingPostInit:
+class TestValidatePatchedInstance:
     @dataclass
     class Cfg:
         name: str
 
-    def test_loading_flag_skips_validation(self):
+    def test_passes_instance_data_to_validation_loader(self):
         ctx = MagicMock()
-        ctx.loading = True
+        ctx.cls = self.Cfg
         ctx.validating = False
-        ctx.original_post_init = None
 
-        post_init = make_validating_post_init(ctx)
-        instance = MagicMock()
-        post_init(instance)
+        validate_patched_instance(ctx, self.Cfg(name="test"))
 
-        ctx.validation_loader.assert_not_called()
+        ctx.validation_loader.assert_called_once_with({"name": "test"})
+        assert ctx.validating is False
 
-    def test_validating_flag_skips_reentrant(self):
+    def test_validating_flag_set_during_validation(self):
+        seen: list[bool] = []
         ctx = MagicMock()
-        ctx.loading = False
-        ctx.validating = True
-        ctx.original_post_init = None
+        ctx.cls = self.Cfg
+        ctx.validating = False
+        ctx.validation_loader = lambda _: seen.append(ctx.validating)
 
-        post_init = make_validating_post_init(ctx)
-        instance = MagicMock()
-        post_init(instance)
+        validate_patched_instance(ctx, self.Cfg(name="test"))
+
+        assert seen == [True]
 
-        ctx.validation_loader.assert_not_called()
 
-    def test_calls_original_post_init(self):
+class TestMakeGuardedPostInit:
+    @pytest.mark.parametrize(
+        ("loading", "validating", "expected_calls"),
+        [
+            pytest.param(False, False, 1, id="regular_init"),
+            pytest.param(True, False, 0, id="loading"),
+            pytest.param(False, True, 0, id="validating"),
+        ],
+    )
+    def test_calls_original_only_outside_internal_builds(self, loading, validating, expected_calls):
         original = MagicMock()
         ctx = MagicMock()
-        ctx.loading = False
-        ctx.validating = False
-        ctx.original_post_init = original
-        ctx.cls = self.Cfg
-        ctx.validation_loader = MagicMock()
-        ctx.error_ctx = MagicMock()
+        ctx.loading = loading
+        ctx.validating = validating
 
-        post_init = make_validating_post_init(ctx)
-        instance = self.Cfg(name="test")
+        post_init = make_guarded_post_init(ctx, original)
+        instance = MagicMock()
         post_init(instance)
 
-        original.assert_called_once_with(instance)
+        assert original.call_count == expected_calls
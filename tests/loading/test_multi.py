@@ -13,6 +13,13 @@ from dature.errors import DatureConfigError, FieldGroupError, MergeConflictError
 from dature.field_path import F
 
 
+def _file_conflict_message(path: str, line: int, *sources: tuple[str, Path]) -> str:
+    blocks = "".join(
+        f"   ├── {text}\n   │   {'^' * len(text)}\n   └── FILE '{file}', line {line}\n" for text, file in sources
+    )
+    return f"Config merge conflicts (1)\n\n  [{path}]  Conflicting values in multiple sources\n{blocks}"
+
+
 class TestMergeLoadAsFunction:
     def test_two_json_sources_last_wins(self, tmp_path: Path):
         defaults = tmp_path / "defaults.json"
@@ -385,17 +392,12 @@ class TestRaiseOnConflict:
                 strategy="raise_on_conflict",
             )
 
-        assert str(exc_info.value) == dedent(f"""\
-            Config merge conflicts (1)
-
-              [host]  Conflicting values in multiple sources
-               ├── "host": "host-a",
-               │   ^^^^^^^^^^^^^^^^^
-               └── FILE '{a}', line 2
-               ├── "host": "host-b"
-               │   ^^^^^^^^^^^^^^^^
-               └── FILE '{b}', line 2
-            """)
+        assert str(exc_info.value) == _file_conflict_message(
+            "host",
+            2,
+            ('"host": "host-a",', a),
+            ('"host": "host-b"', b),
+        )
 
     def test_no_conflict_disjoint_keys(self, tmp_path: Path):
         a = tmp_path / "a.json"
@@ -465,17 +467,12 @@ class TestRaiseOnConflict:
                 strategy="raise_on_conflict",
             )
 
-        assert str(exc_info.value) == dedent(f"""\
-            Config merge conflicts (1)
-
-              [database.host]  Conflicting values in multiple sources
-               ├── "host": "a-host",
-               │   ^^^^^^^^^^^^^^^^^
-               └── FILE '{a}', line 3
-               ├── "host": "b-host"
-               │   ^^^^^^^^^^^^^^^^
-               └── FILE '{b}', line 3
-            """)
+        assert str(exc_info.value) == _file_conflict_message(
+            "database.host",
+            3,
+            ('"host": "a-host",', a),
+            ('"host": "b-host"', b),
+        )
 
     def test_conflict_error_message_format(self, tmp_path: Path):
         a = tmp_path / "a.json"
@@ -496,17 +493,12 @@ class TestRaiseOnConflict:
                 strategy="raise_on_conflict",
             )
 
-        assert str(exc_info.value) == dedent(f"""\
-            Config merge conflicts (1)
-
-              [host]  Conflicting values in multiple sources
-               ├── "host": "a-host"
-               │   ^^^^^^^^^^^^^^^^
-               └── FILE '{a}', line 2
-               ├── "host": "b-host"
-               │   ^^^^^^^^^^^^^^^^
-               └── FILE '{b}', line 2
-            """)
+        assert str(exc_info.value) == _file_conflict_message(
+            "host",
+            2,
+            ('"host": "a-host"', a),
+            ('"host": "b-host"', b),
+        )
 
     def test_conflict_with_env_source(self, tmp_path: Path, monkeypatch):
         a = tmp_path / "a.json"
@@ -48,7 +48,7 @@ class TestMakeDecorator:
 
         assert Config.__init__ is not original_init
 
-    def test_patches_post_init(self, tmp_path: Path):
+    def test_does_not_add_post_init(self, tmp_path: Path):
         json_file = tmp_path / "config.json"
         json_file.write_text('{"name": "test"}')
         metadata = JsonSource(file=json_file)
@@ -64,7 +64,7 @@ class TestMakeDecorator:
         )
         decorator(Config)
 
-        assert hasattr(Config, "__post_init__")
+        assert not hasattr(Config, "__post_init__")
 
     def test_loads_on_init(self, tmp_path: Path):
         json_file = tmp_path / "config.json"
@@ -152,6 +152,35 @@ class TestMakeDecorator:
 
 
 class TestCache:
+    def test_no_cache_reads_source_once_per_init(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        metadata = JsonSource(file=json_file)
+        load_raw_calls: list[bool] = []
+        original_load_raw = JsonSource.load_raw
+
+        def counting_load_raw(self: JsonSource) -> object:
+            load_raw_calls.append(True)
+            return original_load_raw(self)
+
+        monkeypatch.setattr(JsonSource, "load_raw", counting_load_raw)
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        decorator = make_decorator(
+            source=metadata,
+            cache=False,
+            debug=False,
+        )
+        decorator(Config)
+
+        Config()
+
+        assert len(load_raw_calls) == 1
+
     def test_cache_returns_same_data(self, tmp_path: Path):
         json_file = tmp_path / "config.json"
         json_file.write_text('{"name": "original", "port": 8080}')
@@ -177,6 +206,38 @@ class TestCache:
         assert second.name == "original"
         assert second.port == 8080
 
+    def test_cache_reads_source_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"name": "original", "port": 8080}')
+        metadata = JsonSource(file=json_file)
+        load_raw_calls: list[bool] = []
+        original_load_raw = JsonSource.load_raw
+
+        def counting_load_raw(self: JsonSource) -> object:
+            load_raw_calls.append(True)
+            return original_load_raw(self)
+
+        monkeypatch.setattr(JsonSource, "load_raw", counting_load_raw)
+
+        @dataclass
+        class Config:
+            name: str
+            port: int
+
+        decorator = make_decorator(
+            source=metadata,
+            cache=True,
+            debug=False,
+        )
+        decorator(Config)
+
+        assert load_raw_calls == []
+
+        Config()
+        Config(port=9090)
+
+        assert len(load_raw_calls) == 1
+
     def test_no_cache_rereads_file(self, tmp_path: Path):
         json_file = tmp_path / "config.json"
         json_file.write_text('{"name": "original", "port": 8080}')
@@ -10,6 +10,36 @@ from dature import F, JsonSource, load
 from dature.errors import DatureConfigError
 
 
+@dataclass
+class Config:
+    host: str
+    port: int
+
+
+@dataclass
+class DefaultPortConfig:
+    host: str
+    port: int = 8080
+
+
+@dataclass
+class TimeoutConfig:
+    host: str
+    port: int = 9090
+    timeout: int = 30
+
+
+@dataclass
+class Database:
+    host: str
+    port: int
+
+
+@dataclass
+class NestedConfig:
+    db: Database
+
+
 class TestMergeSkipInvalidFields:
     def test_fallback_to_other_source(self, tmp_path: Path):
         source1 = tmp_path / "s1.json"
@@ -18,11 +48,6 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"port": 8080}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         result = load(
             JsonSource(file=source1),
             JsonSource(file=source2),
@@ -40,20 +65,15 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"port": "def"}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int = 9090
-
         result = load(
             JsonSource(file=source1),
             JsonSource(file=source2),
-            schema=Config,
+            schema=DefaultPortConfig,
             skip_invalid_fields=True,
         )
 
         assert result.host == "localhost"
-        assert result.port == 9090
+        assert result.port == 8080
 
     def test_all_sources_invalid_no_default_raises(self, tmp_path: Path):
         source1 = tmp_path / "s1.json"
@@ -62,11 +82,6 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"port": "def"}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         with pytest.raises(DatureConfigError) as exc_info:
             load(
                 JsonSource(file=source1),
@@ -95,19 +110,10 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"db": {"host": "s2-host", "port": 5432}}')
 
-        @dataclass
-        class Database:
-            host: str
-            port: int
-
-        @dataclass
-        class Config:
-            db: Database
-
         result = load(
             JsonSource(file=source1),
             JsonSource(file=source2),
-            schema=Config,
+            schema=NestedConfig,
             skip_invalid_fields=True,
         )
 
@@ -121,11 +127,6 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"port": 8080}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         result = load(
             JsonSource(file=source1, skip_field_if_invalid=True),
             JsonSource(file=source2),
@@ -142,11 +143,6 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"port": 8080}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         result = load(
             JsonSource(file=source1),
             JsonSource(file=source2),
@@ -161,11 +157,6 @@ class TestMergeSkipInvalidFields:
         source1 = tmp_path / "s1.json"
         source1.write_text('{"host": "localhost", "port": "abc"}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         with pytest.raises(DatureConfigError) as exc_info:
             load(
                 JsonSource(file=source1),
@@ -189,11 +180,6 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"host": "localhost", "port": 8080}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         result = load(
             JsonSource(file=source1),
             JsonSource(file=source2),
@@ -212,19 +198,13 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"port": 8080}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-            timeout: int = 30
-
         result = load(
             JsonSource(
                 file=source1,
-                skip_field_if_invalid=(F[Config].port, F[Config].timeout),
+                skip_field_if_invalid=(F[TimeoutConfig].port, F[TimeoutConfig].timeout),
             ),
             JsonSource(file=source2),
-            schema=Config,
+            schema=TimeoutConfig,
         )
 
         assert result.host == "localhost"
@@ -235,11 +215,6 @@ class TestMergeSkipInvalidFields:
         source1 = tmp_path / "s1.json"
         source1.write_text('{"host": 123, "port": "abc"}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         with pytest.raises(DatureConfigError) as exc_info:
             load(
                 JsonSource(
@@ -272,11 +247,6 @@ class TestMergeSkipInvalidFields:
         source2 = tmp_path / "s2.json"
         source2.write_text('{"port": 8080}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         with caplog.at_level(logging.WARNING, logger="dature"):
             load(
                 JsonSource(file=source1),
@@ -297,14 +267,25 @@ class TestSingleSourceSkipInvalidFields:
         json_file = tmp_path / "config.json"
         json_file.write_text('{"host": "localhost", "port": "abc"}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int = 8080
-
         result = load(
             JsonSource(file=json_file, skip_field_if_invalid=True),
-            schema=Config,
+            schema=DefaultPortConfig,
+        )
+
+        assert result.host == "localhost"
+        assert result.port == 8080
+
+    def test_skip_with_list_alias(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"server": "localhost", "port": "abc"}')
+
+        result = load(
+            JsonSource(
+                file=json_file,
+                field_mapping={F[DefaultPortConfig].host: ["server"]},  # type: ignore[dict-item]
+                skip_field_if_invalid=True,
+            ),
+            schema=DefaultPortConfig,
         )
 
         assert result.host == "localhost"
@@ -314,11 +295,6 @@ class TestSingleSourceSkipInvalidFields:
         json_file = tmp_path / "config.json"
         json_file.write_text('{"host": "localhost", "port": "abc"}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int
-
         with pytest.raises(DatureConfigError) as exc_info:
             load(
                 JsonSource(file=json_file, skip_field_if_invalid=True),
@@ -353,18 +329,12 @@ class TestSingleSourceSkipInvalidFields:
         json_file = tmp_path / "config.json"
         json_file.write_text('{"host": "localhost", "port": "abc", "timeout": 60}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int = 9090
-            timeout: int = 30
-
         result = load(
             JsonSource(
                 file=json_file,
-                skip_field_if_invalid=(F[Config].port,),
+                skip_field_if_invalid=(F[TimeoutConfig].port,),
             ),
-            schema=Config,
+            schema=TimeoutConfig,
         )
 
         assert result.host == "localhost"
@@ -375,19 +345,14 @@ class TestSingleSourceSkipInvalidFields:
         json_file = tmp_path / "config.json"
         json_file.write_text('{"host": "localhost", "port": "abc"}')
 
-        @dataclass
-        class Config:
-            host: str
-            port: int = 8080
-
         with caplog.at_level(logging.WARNING, logger="dature"):
             load(
                 JsonSource(file=json_file, skip_field_if_invalid=True),
-                schema=Config,
+                schema=DefaultPortConfig,
             )
 
         warning_messages = [r.getMessage() for r in caplog.records if r.levelno >= logging.WARNING]
-        assert warning_messages == ["[Config] Skipped invalid field 'port'"]
+        assert warning_messages == ["[DefaultPortConfig] Skipped invalid field 'port'"]
 
 
 class TestSkipInvalidSameFieldNameNested:
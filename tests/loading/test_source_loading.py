@@ -8,8 +8,10 @@ import pytest
 
 from dature import EnvFileSource, IniSource, JsonSource, Toml11Source, Yaml12Source, load
 from dature.errors import DatureConfigError, EnvVarExpandError
+from dature.loading.context import build_error_ctx
 from dature.loading.merge_config import MergeConfig, SourceParams, apply_source_init_params
 from dature.loading.source_loading import (
+    SourceContext,
     apply_merge_skip_invalid,
     resolve_skip_invalid,
     should_skip_broken,
@@ -327,6 +329,15 @@ class TestMergeExpandEnvVars:
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 
+ENV_EXPAND_ERROR_TEMPLATE = dedent("""\
+    StrictConfig env expand errors (1)
+
+      [host]  Missing environment variable 'MISSING_HOST'
+       ├── {line_content}
+       │   {caret}
+       └── {source_label} '{file}', line {line}
+""")
+
 
 @dataclass
 class StrictConfig:
@@ -379,14 +390,13 @@ class TestEnvVarExpandErrorFormat:
         eq_pos = line_content.find("=")
         caret_pos = eq_pos + 1 if eq_pos != -1 else 0
         caret_len = len(line_content) - caret_pos
-        assert str(exc_info.value) == dedent(f"""\
-            StrictConfig env expand errors (1)
-
-              [host]  Missing environment variable 'MISSING_HOST'
-               ├── {line_content}
-               │   {" " * caret_pos}{"^" * caret_len}
-               └── {source_label} '{file}', line {line}
-        """)
+        assert str(exc_info.value) == ENV_EXPAND_ERROR_TEMPLATE.format(
+            line_content=line_content,
+            caret=" " * caret_pos + "^" * caret_len,
+            source_label=source_label,
+            file=file,
+            line=line,
+        )
 
 
 class TestShouldSkipBroken:
@@ -473,6 +483,21 @@ class TestApplyMergeSkipInvalid:
         assert result.skipped_paths == []
 
 
+class TestSourceContext:
+    def test_file_content_read_lazily_once(self, tmp_path: Path):
+        ini_file = tmp_path / "c.ini"
+        ini_file.write_text("[app]\nname = first\n")
+        source = IniSource(file=ini_file, prefix="app")
+
+        source_ctx = SourceContext(error_ctx=build_error_ctx(source, "Cfg"))
+        content = source_ctx.file_content
+        ini_file.write_text("[app]\nname = second\n")
+
+        assert content is not None
+        assert content.text == "[app]\nname = first\n"
+        assert source_ctx.file_content is content
+
+
 class TestApplySourceInitParamsNestedStrategy:
     @pytest.mark.parametrize(
         ("source_strategy", "load_strategy", "expected"),
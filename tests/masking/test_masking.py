@@ -101,7 +101,7 @@ class TestMaskJsonValue:
         assert result["normal_field"] == "<REDACTED>"
 
     def test_no_masking_without_heuristic(self):
-        with patch("dature.masking.masking._heuristic_detector", None):
+        with patch("dature.masking.masking._get_heuristic_detector", return_value=None):
             data = {"field": "some_normal_value"}
             secret_paths: frozenset[str] = frozenset()
             result = mask_json_value(data, secret_paths=secret_paths)
@@ -194,7 +194,7 @@ class TestMaskEnvLine:
 
 class TestGracefulDegradation:
     def test_no_masking_without_detector(self):
-        with patch("dature.masking.masking._heuristic_detector", None):
+        with patch("dature.masking.masking._get_heuristic_detector", return_value=None):
             data = {"field": "aB3xK9mZ_looks_random"}
             result = mask_json_value(data, secret_paths=frozenset())
             assert result["field"] == "aB3xK9mZ_looks_random"
@@ -375,7 +375,10 @@ class TestSecretMaskingIntegration:
             connection_id: Literal["conn-1", "conn-2"]
             host: str
 
-        with patch("dature.masking.masking._heuristic_detector", None), pytest.raises(DatureConfigError) as exc_info:
+        with (
+            patch("dature.masking.masking._get_heuristic_detector", return_value=None),
+            pytest.raises(DatureConfigError) as exc_info,
+        ):
             load(JsonSource(file=json_file), mask_secrets=True, schema=Cfg)
 
         assert str(exc_info.value) == "Cfg loading errors (1)"
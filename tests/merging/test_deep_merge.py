@@ -160,3 +160,21 @@ class TestDeepMergeFirstWins:
     )
     def test_non_dict_returns_base(self, base, override, expected):
         assert deep_merge_first_wins(base, override) == expected
+
+
+class TestDeepMergeKeyOrder:
+    @pytest.mark.parametrize(
+        ("strategy", "expected_keys"),
+        [
+            pytest.param("last_wins", ["a", "db", "b", "c"], id="last_wins"),
+            pytest.param("first_wins", ["a", "db", "b", "c"], id="first_wins"),
+        ],
+    )
+    def test_base_keys_first_then_new_override_keys(self, strategy, expected_keys):
+        base = {"a": 1, "db": {"host": "h"}, "b": 2}
+        override = {"c": 3, "b": 4, "db": {"port": 5}}
+
+        result = _DISPATCH[strategy](base, override)
+
+        assert list(result) == expected_keys
+        assert list(result["db"]) == ["host", "port"]
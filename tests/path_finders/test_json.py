@@ -50,3 +50,13 @@ class TestJsonFindLineRange:
         finder = JsonPathFinder(content)
 
         assert finder.find_line_range(["tags"]) == LineRange(start=2, end=2)
+
+    def test_many_keys_map_to_their_lines(self):
+        content = "{\n" + ",\n".join(f'  "key{i}": {i}' for i in range(200)) + "\n}"
+        finder = JsonPathFinder(content)
+
+        assert [finder.find_line_range([f"key{i}"]) for i in (0, 99, 199)] == [
+            LineRange(start=2, end=2),
+            LineRange(start=101, end=101),
+            LineRange(start=201, end=201),
+        ]
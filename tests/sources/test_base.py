@@ -590,7 +590,7 @@ class TestFileFieldMixin:
         ("file_input", "expected_file", "expected_type"),
         [
             ("/data/test.json", "/data/test.json", str),
-            (Path("/data/test.json"), str(Path("/data/test.json")), str),
+            (Path("/data/test.json"), Path("/data/test.json"), Path),
             (None, None, type(None)),
         ],
     )
@@ -1,13 +1,18 @@
 """Tests for json_ module (JsonSource)."""
 
+import json
+import math
 from dataclasses import dataclass
 from io import StringIO
 from pathlib import Path
+from typing import NoReturn
 
 import pytest
 
 from dature import JsonSource, load
 from dature.errors import DatureConfigError, FieldLoadError
+from dature.loading.context import build_error_ctx
+from dature.sources import json_ as json_module
 from examples.all_types_dataclass import EXPECTED_ALL_TYPES, AllPythonTypesCompact
 from tests.sources.checker import assert_all_types_equal
 
@@ -177,3 +182,90 @@ class TestJsonSourceStream:
 
         assert result.name == "test"
         assert result.port == 8080
+
+
+class TestJsonParsing:
+    @pytest.fixture(params=["default", "stdlib_only"])
+    def parser_mode(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+        mode: str = request.param
+        if mode == "stdlib_only":
+            monkeypatch.setattr(json_module, "_get_orjson_loads", lambda: None)
+        return mode
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            pytest.param(b'{"name": "test", "port": 8080}', {"name": "test", "port": 8080}, id="plain"),
+            pytest.param(
+                b'{"big": 123456789012345678901234567890}', {"big": 123456789012345678901234567890}, id="big_int"
+            ),
+            pytest.param(b'{"big": 18446744073709551616}', {"big": 18446744073709551616}, id="above_uint64"),
+            pytest.param(b'{"big": -9223372036854775809}', {"big": -9223372036854775809}, id="below_int64"),
+            pytest.param(b'\xef\xbb\xbf{"name": "bom"}', {"name": "bom"}, id="utf8_bom"),
+        ],
+    )
+    @pytest.mark.usefixtures("parser_mode")
+    def test_parses_same_with_and_without_orjson(self, content: bytes, expected: dict[str, object]):
+        assert json_module._parse_json(content) == expected
+
+    def test_orjson_used_when_installed(self, monkeypatch: pytest.MonkeyPatch):
+        pytest.importorskip("orjson")
+
+        def stdlib_loads(*_args: object, **_kwargs: object) -> NoReturn:
+            msg = "stdlib json parser used"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(json, "loads", stdlib_loads)
+
+        assert json_module._parse_json(b'{"name": "test", "port": 8080, "id": 123456789012345678}') == {
+            "name": "test",
+            "port": 8080,
+            "id": 123456789012345678,
+        }
+
+    @pytest.mark.usefixtures("parser_mode")
+    def test_nan_accepted(self):
+        result = json_module._parse_json(b'{"ratio": NaN}')
+
+        assert isinstance(result, dict)
+        assert math.isnan(result["ratio"])
+
+    @pytest.mark.usefixtures("parser_mode")
+    def test_broken_json_raises_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            json_module._parse_json(b'{"name": }')
+
+        assert str(exc_info.value) == "Expecting value: line 1 column 10 (char 9)"
+
+
+class TestJsonLoadedBytes:
+    def test_load_raw_returns_parsed_bytes(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"port": "abc"}\n')
+
+        result = JsonSource(file=json_file).load_raw()
+
+        assert result.loaded_bytes == b'{"port": "abc"}\n'
+
+    def test_stream_has_no_loaded_bytes(self):
+        result = JsonSource(file=StringIO('{"port": 1}')).load_raw()
+
+        assert result.loaded_bytes is None
+
+    def test_error_context_renders_loaded_bytes(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"port": "abc"}\n')
+        source = JsonSource(file=json_file)
+        result = source.load_raw()
+        json_file.write_text('{"port": "changed on disk"}\n')
+
+        error_ctx = build_error_ctx(source, "Cfg", loaded_bytes=result.loaded_bytes)
+
+        assert error_ctx.file_content_for_errors() == '{"port": "abc"}\n'
+        assert source.file_content_for_errors() == '{"port": "changed on disk"}\n'
+
+    def test_not_loaded_reads_file(self, tmp_path: Path):
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"port": 1}')
+
+        assert JsonSource(file=json_file).file_content_for_errors() == '{"port": 1}'
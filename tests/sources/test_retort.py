@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, make_dataclass
+from typing import Annotated
 
 import pytest
 from adaptix import NameStyle as AdaptixNameStyle
 from adaptix import Retort
+from adaptix.load_error import AggregateLoadError
 
 from dature import V
 from dature.field_path import F
@@ -16,6 +19,8 @@ from dature.sources.retort import (
     ensure_retort,
     get_adaptix_name_style,
     get_name_mapping_providers,
+    get_probe_retort,
+    get_validating_retort,
     get_validator_providers,
     transform_to_dataclass,
 )
@@ -120,7 +125,26 @@ class TestGetValidatorProviders:
 
         result = get_validator_providers(Config)
 
-        assert result == []
+        assert result == ()
+
+    def test_computed_once_per_schema(self):
+        @dataclass
+        class Config:
+            port: Annotated[int, V >= 1]
+
+        first = get_validator_providers(Config)
+
+        assert len(first) == 1
+        assert get_validator_providers(Config) is first
+
+    def test_cache_is_bounded(self):
+        maxsize = get_validator_providers.cache_info().maxsize
+        assert maxsize is not None
+
+        for idx in range(maxsize + 1):
+            get_validator_providers(make_dataclass(f"Cfg{idx}", [("name", str)]))
+
+        assert get_validator_providers.cache_info().currsize == maxsize
 
 
 class TestBuildBaseRecipe:
@@ -183,6 +207,54 @@ class TestCreateProbeRetort:
         assert isinstance(result, Retort)
 
 
+class TestGetProbeRetort:
+    @dataclass
+    class Config:
+        name: str
+
+    def test_reused_across_sources_configured_alike(self):
+        first = get_probe_retort(MockSource(), self.Config)
+
+        second = get_probe_retort(MockSource(), self.Config)
+
+        assert second is first
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            pytest.param(MockSource(name_style="upper_snake"), id="name_style"),
+            pytest.param(MockSource(field_mapping={F[Config].name: "title"}), id="field_mapping"),
+            pytest.param(MockSource(type_loaders={str: str.upper}), id="type_loaders"),
+        ],
+    )
+    def test_different_setup_gets_own_retort(self, source: MockSource):
+        default = get_probe_retort(MockSource(), self.Config)
+
+        result = get_probe_retort(source, self.Config)
+
+        assert result is not default
+
+    def test_unhashable_field_mapping_gets_fresh_retort(self):
+        source = MockSource(field_mapping={F[TestGetProbeRetort.Config].name: ["alias"]})  # type: ignore[dict-item]
+
+        first = get_probe_retort(source, self.Config)
+        second = get_probe_retort(source, self.Config)
+
+        assert second is not first
+
+    def test_least_recently_used_retort_evicted(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("dature.sources.retort._PROBE_RETORT_CACHE_SIZE", 2)
+        monkeypatch.setattr("dature.sources.retort._probe_retort_cache", {})
+        first = get_probe_retort(MockSource(), self.Config)
+        second = get_probe_retort(MockSource(name_style="upper_snake"), self.Config)
+
+        get_probe_retort(MockSource(), self.Config)
+        get_probe_retort(MockSource(name_style="lower_camel"), self.Config)
+
+        assert get_probe_retort(MockSource(), self.Config) is first
+        assert get_probe_retort(MockSource(name_style="upper_snake"), self.Config) is not second
+
+
 class TestCreateValidatingRetort:
     def test_returns_retort(self):
         @dataclass
@@ -209,6 +281,85 @@ class TestCreateValidatingRetort:
         assert isinstance(result, Retort)
 
 
+class TestGetValidatingRetort:
+    @dataclass
+    class Config:
+        name: str
+
+    def test_reused_across_sources_configured_alike(self):
+        first = get_validating_retort(MockSource(), self.Config)
+
+        second = get_validating_retort(MockSource(), self.Config)
+
+        assert second is first
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            pytest.param(MockSource(name_style="upper_snake"), id="name_style"),
+            pytest.param(MockSource(validators={F[Config].name: V.len() >= 1}), id="validators"),
+            pytest.param(MockSource(root_validators=(V.root(lambda _: True),)), id="root_validators"),
+        ],
+    )
+    def test_different_setup_gets_own_retort(self, source: MockSource):
+        default = get_validating_retort(MockSource(), self.Config)
+
+        result = get_validating_retort(source, self.Config)
+
+        assert result is not default
+
+    @pytest.mark.parametrize(
+        "make_source",
+        [
+            pytest.param(
+                lambda: MockSource(field_mapping={F[TestGetValidatingRetort.Config].name: ["alias"]}),  # type: ignore[dict-item]
+                id="unhashable_field_mapping",
+            ),
+            pytest.param(
+                lambda: MockSource(root_validators=iter((V.root(lambda _: True),))),
+                id="iterator_root_validators",
+            ),
+        ],
+    )
+    def test_uncacheable_setup_gets_fresh_retort(self, make_source: Callable[[], MockSource]):
+        first = get_validating_retort(make_source(), self.Config)
+
+        second = get_validating_retort(make_source(), self.Config)
+
+        assert second is not first
+
+    def test_equal_predicates_keep_own_messages(self):
+        @dataclass
+        class Counter:
+            count: int
+
+        messages: list[str] = []
+        for threshold in (1, 1.0, True):
+            source = MockSource(validators={F[Counter].count: V > threshold})  # noqa: SIM300
+            loader = get_validating_retort(source, Counter).get_loader(Counter)
+            with pytest.raises(AggregateLoadError) as exc_info:
+                loader({"count": 0})
+            messages.extend(str(sub.msg) for sub in exc_info.value.exceptions)
+
+        assert messages == [
+            "Value must be greater than 1",
+            "Value must be greater than 1.0",
+            "Value must be greater than True",
+        ]
+
+    def test_least_recently_used_retort_evicted(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("dature.sources.retort._VALIDATING_RETORT_CACHE_SIZE", 2)
+        monkeypatch.setattr("dature.sources.retort._validating_retort_cache", {})
+        first = get_validating_retort(MockSource(), self.Config)
+        second = get_validating_retort(MockSource(name_style="upper_snake"), self.Config)
+
+        get_validating_retort(MockSource(), self.Config)
+        get_validating_retort(MockSource(name_style="lower_camel"), self.Config)
+
+        assert get_validating_retort(MockSource(), self.Config) is first
+        assert get_validating_retort(MockSource(name_style="upper_snake"), self.Config) is not second
+
+
 class TestRetortCacheKey:
     def test_none_loaders_produces_empty_frozenset(self):
         @dataclass
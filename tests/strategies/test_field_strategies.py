@@ -116,3 +116,12 @@ class TestProtocol:
         strategy = TakeMax()
         assert isinstance(strategy, FieldMergeStrategy)
         assert strategy([3, 1, 2]) == 3
+
+
+class TestSlots:
+    @pytest.mark.parametrize(
+        "strategy_cls",
+        [FieldFirstWins, FieldLastWins, FieldAppend, FieldAppendUnique, FieldPrepend, FieldPrependUnique],
+    )
+    def test_builtin_strategies_have_no_instance_dict(self, strategy_cls):
+        assert not hasattr(strategy_cls(), "__dict__")
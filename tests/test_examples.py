@@ -8,6 +8,9 @@ from dataclasses import dataclass
 
 import pytest
 
+# Every example runs in its own interpreter; together they dominate the suite's wall time.
+pytestmark = pytest.mark.slow
+
 EXAMPLES_DIR = pathlib.Path(__file__).parent.parent / "examples"
 PROJECT_SRC = pathlib.Path(__file__).parent.parent / "src"
 
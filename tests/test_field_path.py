@@ -1,9 +1,10 @@
 """Tests for FieldPath lazy field path builder."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, make_dataclass
 
 import pytest
 
+from dature import field_path as field_path_module
 from dature.field_path import F, FieldPath, extract_field_path, validate_field_path_owner
 
 
@@ -61,6 +62,39 @@ class TestFieldPath:
         fp = F["Whatever"].anything.deep.path
         assert fp.as_path() == "anything.deep.path"
 
+    def test_field_types_resolved_once_per_class(self, monkeypatch: pytest.MonkeyPatch):
+        @dataclass
+        class Inner:
+            uri: str
+
+        @dataclass
+        class Outer:
+            inner: Inner
+
+        calls: list[type] = []
+        original = field_path_module.get_type_hints
+
+        def counting_get_type_hints(obj: type) -> dict[str, object]:
+            calls.append(obj)
+            return original(obj)
+
+        monkeypatch.setattr(field_path_module, "get_type_hints", counting_get_type_hints)
+
+        _ = F[Outer].inner.uri
+        _ = F[Outer].inner.uri
+
+        assert calls == [Outer, Inner]
+
+    def test_field_types_cache_is_bounded(self):
+        maxsize = field_path_module._field_types.cache_info().maxsize
+        assert maxsize is not None
+
+        for idx in range(maxsize + 1):
+            schema = make_dataclass(f"Cfg{idx}", [("name", str)])
+            _ = F[schema].name
+
+        assert field_path_module._field_types.cache_info().currsize == maxsize
+
 
 class TestValidateFieldPathOwner:
     def test_string_owner_matches(self):
@@ -5,16 +5,15 @@ import sys
 
 import pytest
 
+_OPTIONAL_MODULES = [
+    "json5",
+    "ruamel.yaml",
+    "toml_rs",
+    "random_string_detector",
+]
 
-@pytest.mark.parametrize(
-    "optional_module",
-    [
-        "json5",
-        "ruamel.yaml",
-        "toml_rs",
-        "random_string_detector",
-    ],
-)
+
+@pytest.mark.parametrize("optional_module", _OPTIONAL_MODULES)
 def test_dature_imports_without_optional_dep(optional_module: str, monkeypatch: pytest.MonkeyPatch) -> None:
     # `sys.modules[name] = None` is the documented way to make `import name` raise ImportError.
     monkeypatch.setitem(sys.modules, optional_module, None)
@@ -32,3 +31,15 @@ def test_dature_imports_without_optional_dep(optional_module: str, monkeypatch:
     assert dature.Yaml12Source.format_name == "yaml1.2"
     assert dature.Toml10Source.format_name == "toml1.0"
     assert dature.Toml11Source.format_name == "toml1.1"
+
+
+@pytest.mark.parametrize("optional_module", _OPTIONAL_MODULES)
+def test_dature_import_does_not_load_optional_dep(optional_module: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in [n for n in sys.modules if n == optional_module or n.startswith(f"{optional_module}.")]:
+        monkeypatch.delitem(sys.modules, name)
+    for name in [n for n in sys.modules if n == "dature" or n.startswith("dature.")]:
+        monkeypatch.delitem(sys.modules, name)
+
+    importlib.import_module("dature")
+
+    assert optional_module not in sys.modules
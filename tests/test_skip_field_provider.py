@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 
+import pytest
 from adaptix import Retort
 
 from dature.skip_field_provider import (
@@ -94,3 +95,68 @@ class TestFilterInvalidFields:
 
         assert result.cleaned_dict == "not a dict"
         assert result.skipped_paths == []
+
+    def test_raw_dict_left_unchanged(self):
+        @dataclass
+        class Database:
+            host: str
+            port: int
+
+        @dataclass
+        class Config:
+            db: Database
+            tags: list[str]
+
+        probe = Retort(
+            strict_coercion=False,
+            recipe=[SkipFieldProvider(), ModelToDictProvider()],
+        )
+        raw = {"db": {"host": "localhost", "port": "abc"}, "tags": ["a"]}
+        result = filter_invalid_fields(raw, probe, Config, None)
+
+        assert result.cleaned_dict == {"db": {"host": "localhost"}, "tags": ["a"]}
+        assert raw == {"db": {"host": "localhost", "port": "abc"}, "tags": ["a"]}
+
+    @pytest.mark.parametrize(
+        ("allowed_fields", "expected_cleaned", "expected_skipped"),
+        [
+            pytest.param(
+                {"db.port"},
+                {"port": "bad", "db": {"host": "localhost"}},
+                ["db.port"],
+                id="nested_only",
+            ),
+            pytest.param(
+                {"port"},
+                {"db": {"host": "localhost", "port": "abc"}},
+                ["port"],
+                id="root_only",
+            ),
+            pytest.param(
+                set(),
+                {"port": "bad", "db": {"host": "localhost", "port": "abc"}},
+                [],
+                id="empty",
+            ),
+        ],
+    )
+    def test_allowed_fields_nested(self, allowed_fields, expected_cleaned, expected_skipped):
+        @dataclass
+        class Database:
+            host: str
+            port: int
+
+        @dataclass
+        class Config:
+            port: int
+            db: Database
+
+        probe = Retort(
+            strict_coercion=False,
+            recipe=[SkipFieldProvider(), ModelToDictProvider()],
+        )
+        raw = {"port": "bad", "db": {"host": "localhost", "port": "abc"}}
+        result = filter_invalid_fields(raw, probe, Config, allowed_fields)
+
+        assert result.cleaned_dict == expected_cleaned
+        assert result.skipped_paths == expected_skipped
@@ -0,0 +1,27 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+pytest.register_assert_rewrite("tests.validators.expected")
+
+
+@pytest.fixture(scope="session")
+def json_file_factory(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], Path]:
+    """Return a function that writes ``.json`` content once and hands back its path.
+
+    Files are shared by the whole session, one per distinct content, so tests must not
+    modify them.
+    """
+    directory = tmp_path_factory.mktemp("validators")
+    paths: dict[str, Path] = {}
+
+    def make(content: str) -> Path:
+        path = paths.get(content)
+        if path is None:
+            path = directory / f"config_{len(paths)}.json"
+            path.write_text(content)
+            paths[content] = path
+        return path
+
+    return make
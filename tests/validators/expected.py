@@ -0,0 +1,33 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from dature.errors import DatureConfigError
+
+FIELD_ERROR_TEMPLATE = "  [{path}]  {message}\n   ├── {content}\n   │{caret}\n   └── FILE '{file}', line 1"
+
+
+def assert_single_field_error(  # noqa: PLR0913
+    func: Callable[[], object],
+    *,
+    schema_name: str,
+    path: str,
+    message: str,
+    content: str,
+    caret: str,
+    file: Path,
+) -> None:
+    with pytest.raises(DatureConfigError) as exc_info:
+        func()
+
+    e = exc_info.value
+    assert len(e.exceptions) == 1
+    assert str(e) == f"{schema_name} loading errors (1)"
+    assert str(e.exceptions[0]) == FIELD_ERROR_TEMPLATE.format(
+        path=path,
+        message=message,
+        content=content,
+        caret=caret,
+        file=file,
+    )
@@ -4,6 +4,7 @@ import pytest
 
 from dature import V
 from dature.validators.collection import EachPredicate, InPredicate
+from dature.validators.predicate import Predicate
 
 
 class TestIn:
@@ -16,34 +17,6 @@ class TestIn:
         pred = V.in_(iter(["a", "b"]))
         assert pred.values == ("a", "b")
 
-    def test_runtime(self) -> None:
-        func = V.in_(("admin", "user")).get_validator_func()
-        assert func("admin") is True
-        assert func("user") is True
-        assert func("guest") is False
-
-    def test_default_message(self) -> None:
-        assert V.in_(("a", "b")).get_error_message() == "Value must be one of: 'a', 'b'"
-
-    def test_override_via_kwarg(self) -> None:
-        assert V.in_(("a", "b"), error_message="bad value").get_error_message() == "bad value"
-
-
-class TestUniqueItems:
-    def test_runtime(self) -> None:
-        func = V.unique_items().get_validator_func()
-        assert func([]) is True
-        assert func([1]) is True
-        assert func([1, 2, 3]) is True
-        assert func([1, 1]) is False
-        assert func([1, 2, 1]) is False
-
-    def test_default_message(self) -> None:
-        assert V.unique_items().get_error_message() == "Value must contain unique items"
-
-    def test_override_via_kwarg(self) -> None:
-        assert V.unique_items(error_message="dup").get_error_message() == "dup"
-
 
 class TestEach:
     def test_construction(self) -> None:
@@ -52,27 +25,73 @@ class TestEach:
         assert isinstance(pred, EachPredicate)
         assert pred.inner is inner
 
-    def test_runtime(self) -> None:
-        func = V.each(V.len() >= 3).get_validator_func()
-        assert func([]) is True
-        assert func(["abc", "abcd"]) is True
-        assert func(["ab", "abc"]) is False
-        assert func(["abc", "ab", "abcd"]) is False
-
-    def test_composed_inner(self) -> None:
-        inner = (V.len() >= 2) & V.matches(r"^[a-z]+$")
-        func = V.each(inner).get_validator_func()
-        assert func(["ab", "cde"]) is True
-        assert func(["a", "bc"]) is False
-        assert func(["Ab", "cd"]) is False
-
     def test_rejects_non_predicate(self) -> None:
         with pytest.raises(TypeError, match=r"V\.each"):
             V.each("not a predicate")
 
-    def test_default_message_delegates_to_inner(self) -> None:
-        pred = V.each(V.len() >= 3)
-        assert pred.get_error_message() == (V.len() >= 3).get_error_message()
 
-    def test_override_via_kwarg(self) -> None:
-        assert V.each(V.len() >= 3, error_message="elem too short").get_error_message() == "elem too short"
+class TestCollectionRuntime:
+    @pytest.mark.parametrize(
+        ("predicate", "good", "bad"),
+        [
+            pytest.param(V.in_(("admin", "user")), ["admin", "user"], ["guest"], id="in"),
+            pytest.param(
+                V.unique_items(),
+                [[], [1], [1, 2, 3], (1, 2), {1, 2}, frozenset({1, 2})],
+                [[1, 1], [1, 2, 1], (1, 1)],
+                id="unique_items",
+            ),
+            pytest.param(
+                V.unique_items(),
+                [[f"item-{i}" for i in range(10_000)]],
+                [[*(f"item-{i}" for i in range(10_000)), "item-0"]],
+                id="unique_items_large",
+            ),
+            pytest.param(
+                V.each(V.len() >= 3),
+                [[], ["abc", "abcd"]],
+                [["ab", "abc"], ["abc", "ab", "abcd"]],
+                id="each",
+            ),
+            pytest.param(
+                V.each((V.len() >= 2) & V.matches(r"^[a-z]+$")),
+                [["ab", "cde"]],
+                [["a", "bc"], ["Ab", "cd"]],
+                id="each_composed_inner",
+            ),
+        ],
+    )
+    def test_validator_func(self, predicate: Predicate, good: list[object], bad: list[object]) -> None:
+        func = predicate.get_validator_func()
+        for g in good:
+            assert func(g) is True
+        for b in bad:
+            assert func(b) is False
+
+
+class TestCollectionErrorMessage:
+    @pytest.mark.parametrize(
+        ("predicate", "expected"),
+        [
+            pytest.param(V.in_(("a", "b")), "Value must be one of: 'a', 'b'", id="in"),
+            pytest.param(V.unique_items(), "Value must contain unique items", id="unique_items"),
+            pytest.param(
+                V.each(V.len() >= 3),
+                "Value length must be greater than or equal to 3",
+                id="each_delegates_to_inner",
+            ),
+        ],
+    )
+    def test_default_message(self, predicate: Predicate, expected: str) -> None:
+        assert predicate.get_error_message() == expected
+
+    @pytest.mark.parametrize(
+        ("predicate", "expected"),
+        [
+            pytest.param(V.in_(("a", "b"), error_message="bad value"), "bad value", id="in"),
+            pytest.param(V.unique_items(error_message="dup"), "dup", id="unique_items"),
+            pytest.param(V.each(V.len() >= 3, error_message="elem too short"), "elem too short", id="each"),
+        ],
+    )
+    def test_override_via_kwarg(self, predicate: Predicate, expected: str) -> None:
+        assert predicate.get_error_message() == expected
@@ -3,7 +3,7 @@
 import pytest
 
 from dature import V
-from dature.validators.predicate import AndPredicate, NotPredicate, OrPredicate
+from dature.validators.predicate import AndPredicate, NotPredicate, OrPredicate, Predicate
 
 
 class TestAnd:
@@ -67,3 +67,23 @@ class TestComposeWithNonPredicate:
     def test_or_rejects_non_predicate(self) -> None:
         with pytest.raises(TypeError):
             _ = (V >= 1) | 42  # type: ignore[operator]
+
+
+class TestPredicateLayout:
+    @pytest.mark.parametrize(
+        "predicate",
+        [
+            pytest.param(V > 0, id="compare"),
+            pytest.param(V.len() >= 1, id="length"),
+            pytest.param(V.matches(r"^a"), id="matches"),
+            pytest.param(V.in_(("a",)), id="in"),
+            pytest.param(V.unique_items(), id="unique_items"),
+            pytest.param(V.each(V > 0), id="each"),
+            pytest.param(V.check(bool, error_message="x"), id="check"),
+            pytest.param((V > 0) & (V < 10), id="and"),
+            pytest.param((V < 0) | (V > 10), id="or"),
+            pytest.param(~(V > 0), id="not"),
+        ],
+    )
+    def test_no_instance_dict(self, predicate: Predicate) -> None:
+        assert not hasattr(predicate, "__dict__")
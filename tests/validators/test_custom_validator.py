@@ -6,7 +6,9 @@ no longer supported — ``V.check(func, error_message=...)`` is the sanctioned w
 to express validation logic not covered by built-in predicates.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 from typing import Annotated
 
@@ -14,120 +16,102 @@ import pytest
 
 from dature import JsonSource, V, load
 from dature.errors import DatureConfigError
+from tests.validators.expected import FIELD_ERROR_TEMPLATE, assert_single_field_error
 
 
-class TestVCheckAnnotated:
-    def test_success(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            count: Annotated[int, V.check(lambda v: v % 5 == 0, error_message="Value must be divisible by 5")]
+@dataclass
+class CountConfig:
+    count: Annotated[int, V.check(lambda v: v % 5 == 0, error_message="Value must be divisible by 5")]
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"count": 10}')
 
-        metadata = JsonSource(file=json_file)
-        result = load(metadata, schema=Config)
+@dataclass
+class UrlConfig:
+    url: Annotated[
+        str,
+        V.check(lambda v: v.startswith("https://"), error_message="Value must start with 'https://'"),
+    ]
 
-        assert result.count == 10
 
-    def test_failure(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            count: Annotated[int, V.check(lambda v: v % 5 == 0, error_message="Value must be divisible by 5")]
+@dataclass
+class CountUrlConfig:
+    count: Annotated[int, V.check(lambda v: v % 5 == 0, error_message="Value must be divisible by 5")]
+    url: Annotated[
+        str,
+        V.check(lambda v: v.startswith("https://"), error_message="Value must start with 'https://'"),
+    ]
 
-        json_file = tmp_path / "config.json"
+
+class TestVCheckAnnotated:
+    def test_success(self):
+        metadata = JsonSource(file=StringIO('{"count": 10}'))
+        result = load(metadata, schema=CountConfig)
+
+        assert result.count == 10
+
+    def test_failure(self, json_file_factory: Callable[[str], Path]):
         content = '{"count": 7}'
-        json_file.write_text(content)
+        json_file = json_file_factory(content)
 
         metadata = JsonSource(file=json_file)
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            f"  [count]  Value must be divisible by 5\n"
-            f"   ├── {content}\n"
-            f"   │             ^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert_single_field_error(
+            lambda: load(metadata, schema=CountConfig),
+            schema_name="CountConfig",
+            path="count",
+            message="Value must be divisible by 5",
+            content=content,
+            caret="             ^",
+            file=json_file,
         )
 
-    def test_custom_error_message(self, tmp_path: Path):
+    def test_custom_error_message(self, json_file_factory: Callable[[str], Path]):
         @dataclass
         class Config:
             count: Annotated[int, V.check(lambda v: v % 3 == 0, error_message="Must be a multiple of 3")]
 
-        json_file = tmp_path / "config.json"
         content = '{"count": 7}'
-        json_file.write_text(content)
+        json_file = json_file_factory(content)
 
         metadata = JsonSource(file=json_file)
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            f"  [count]  Must be a multiple of 3\n"
-            f"   ├── {content}\n"
-            f"   │             ^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert_single_field_error(
+            lambda: load(metadata, schema=Config),
+            schema_name="Config",
+            path="count",
+            message="Must be a multiple of 3",
+            content=content,
+            caret="             ^",
+            file=json_file,
         )
 
 
 class TestVCheckOnStrings:
-    def test_success(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            url: Annotated[
-                str,
-                V.check(lambda v: v.startswith("https://"), error_message="Value must start with 'https://'"),
-            ]
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"url": "https://example.com"}')
-
-        metadata = JsonSource(file=json_file)
-        result = load(metadata, schema=Config)
+    def test_success(self):
+        metadata = JsonSource(file=StringIO('{"url": "https://example.com"}'))
+        result = load(metadata, schema=UrlConfig)
 
         assert result.url == "https://example.com"
 
-    def test_failure(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            url: Annotated[
-                str,
-                V.check(lambda v: v.startswith("https://"), error_message="Value must start with 'https://'"),
-            ]
-
-        json_file = tmp_path / "config.json"
+    def test_failure(self, json_file_factory: Callable[[str], Path]):
         content = '{"url": "http://example.com"}'
-        json_file.write_text(content)
+        json_file = json_file_factory(content)
 
         metadata = JsonSource(file=json_file)
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            f"  [url]  Value must start with 'https://'\n"
-            f"   ├── {content}\n"
-            f"   │            ^^^^^^^^^^^^^^^^^^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert_single_field_error(
+            lambda: load(metadata, schema=UrlConfig),
+            schema_name="UrlConfig",
+            path="url",
+            message="Value must start with 'https://'",
+            content=content,
+            caret="            ^^^^^^^^^^^^^^^^^^",
+            file=json_file,
         )
 
 
 class TestVCheckWithDecorator:
-    def test_success(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080}')
+    def test_success(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"port": 8080}')
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -137,33 +121,28 @@ class TestVCheckWithDecorator:
         config = Config()
         assert config.port == 8080
 
-    def test_failure(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
+    def test_failure(self, json_file_factory: Callable[[str], Path]):
         content = '{"port": 8081}'
-        json_file.write_text(content)
+        json_file = json_file_factory(content)
 
         @load(JsonSource(file=json_file))
         @dataclass
         class Config:
             port: Annotated[int, V.check(lambda v: v % 10 == 0, error_message="Value must be divisible by 10")]
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            Config()
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            f"  [port]  Value must be divisible by 10\n"
-            f"   ├── {content}\n"
-            f"   │            ^^^^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert_single_field_error(
+            Config,
+            schema_name="Config",
+            path="port",
+            message="Value must be divisible by 10",
+            content=content,
+            caret="            ^^^^",
+            file=json_file,
         )
 
-    def test_direct_instantiation_validates(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
+    def test_direct_instantiation_validates(self, json_file_factory: Callable[[str], Path]):
         content = '{"port": 8080}'
-        json_file.write_text(content)
+        json_file = json_file_factory(content)
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -182,54 +161,36 @@ class TestVCheckWithDecorator:
 
 
 class TestMultipleVCheckPredicates:
-    def test_combined_success(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            count: Annotated[int, V.check(lambda v: v % 5 == 0, error_message="Value must be divisible by 5")]
-            url: Annotated[
-                str,
-                V.check(lambda v: v.startswith("https://"), error_message="Value must start with 'https://'"),
-            ]
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"count": 15, "url": "https://example.com"}')
-
-        metadata = JsonSource(file=json_file)
-        result = load(metadata, schema=Config)
+    def test_combined_success(self):
+        metadata = JsonSource(file=StringIO('{"count": 15, "url": "https://example.com"}'))
+        result = load(metadata, schema=CountUrlConfig)
 
         assert result.count == 15
         assert result.url == "https://example.com"
 
-    def test_all_fail(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            count: Annotated[int, V.check(lambda v: v % 5 == 0, error_message="Value must be divisible by 5")]
-            url: Annotated[
-                str,
-                V.check(lambda v: v.startswith("https://"), error_message="Value must start with 'https://'"),
-            ]
-
-        json_file = tmp_path / "config.json"
+    def test_all_fail(self, json_file_factory: Callable[[str], Path]):
         content = '{"count": 7, "url": "http://example.com"}'
-        json_file.write_text(content)
+        json_file = json_file_factory(content)
 
         metadata = JsonSource(file=json_file)
 
         with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
+            load(metadata, schema=CountUrlConfig)
 
         e = exc_info.value
         assert len(e.exceptions) == 2
-        assert str(e) == "Config loading errors (2)"
-        assert str(e.exceptions[0]) == (
-            f"  [count]  Value must be divisible by 5\n"
-            f"   ├── {content}\n"
-            f"   │             ^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert str(e) == "CountUrlConfig loading errors (2)"
+        assert str(e.exceptions[0]) == FIELD_ERROR_TEMPLATE.format(
+            path="count",
+            message="Value must be divisible by 5",
+            content=content,
+            caret="             ^",
+            file=json_file,
         )
-        assert str(e.exceptions[1]) == (
-            f"  [url]  Value must start with 'https://'\n"
-            f"   ├── {content}\n"
-            f"   │                        ^^^^^^^^^^^^^^^^^^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert str(e.exceptions[1]) == FIELD_ERROR_TEMPLATE.format(
+            path="url",
+            message="Value must start with 'https://'",
+            content=content,
+            caret="                        ^^^^^^^^^^^^^^^^^^",
+            file=json_file,
         )
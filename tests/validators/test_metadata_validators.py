@@ -1,4 +1,6 @@
+from collections.abc import Callable
 from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 from typing import Annotated
 
@@ -6,440 +8,334 @@ import pytest
 
 from dature import JsonSource, V, load
 from dature.errors import DatureConfigError
-from dature.field_path import F
+from dature.field_path import F, FieldPath
+from dature.validators.predicate import Predicate
+from tests.validators.expected import assert_single_field_error
 
 
-class TestMetadataValidatorsSuccess:
-    def test_single_validator(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: str
+@dataclass
+class NameConfig:
+    name: str
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"name": "Alice"}')
 
-        metadata = JsonSource(
-            file=json_file,
-            validators={
-                F[Config].name: V.len() >= 3,
-            },
-        )
-        result = load(metadata, schema=Config)
+@dataclass
+class PortConfig:
+    port: int
 
-        assert result.name == "Alice"
 
-    def test_tuple_validators(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: int
+@dataclass
+class NamePortConfig:
+    name: str
+    port: int
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080}')
 
-        metadata = JsonSource(
-            file=json_file,
-            validators={
-                F[Config].port: (V > 0, V < 65536),
-            },
-        )
-        result = load(metadata, schema=Config)
+@dataclass
+class Database:
+    host: str
+    port: int
 
-        assert result.port == 8080
 
-    def test_multiple_fields(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: str
-            port: int
+@dataclass
+class DatabaseConfig:
+    database: Database
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"name": "Alice", "port": 8080}')
 
-        metadata = JsonSource(
-            file=json_file,
-            validators={
-                F[Config].name: V.len() >= 3,
-                F[Config].port: V > 0,
-            },
-        )
-        result = load(metadata, schema=Config)
-
-        assert result.name == "Alice"
-        assert result.port == 8080
-
-
-class TestMetadataValidatorsFailure:
-    def test_single_validator_fails(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: str
-
-        json_file = tmp_path / "config.json"
-        content = '{"name": "Al"}'
-        json_file.write_text(content)
-
-        metadata = JsonSource(
-            file=json_file,
-            validators={
-                F[Config].name: V.len() >= 3,
-            },
-        )
+@dataclass
+class AnnotatedNamePortConfig:
+    name: Annotated[str, V.len() >= 3]
+    port: int
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
 
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            "  [name]  Value length must be greater than or equal to 3\n"
-            f"   ├── {content}\n"
-            "   │             ^^\n"
-            f"   └── FILE '{json_file}', line 1"
-        )
+@dataclass
+class MinLength3Config:
+    name: Annotated[str, V.len() >= 3]
 
-    def test_tuple_validator_fails(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: int
 
-        json_file = tmp_path / "config.json"
-        content = '{"port": -1}'
-        json_file.write_text(content)
+@dataclass
+class MinLength5Config:
+    name: Annotated[str, V.len() >= 5]
 
-        metadata = JsonSource(
-            file=json_file,
-            validators={
-                F[Config].port: (V > 0, V < 65536),
-            },
-        )
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
+@dataclass
+class NonNegativePortConfig:
+    port: Annotated[int, V >= 0]
 
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            "  [port]  Value must be greater than 0\n"
-            f"   ├── {content}\n"
-            "   │            ^^\n"
-            f"   └── FILE '{json_file}', line 1"
-        )
 
+@dataclass
+class UnprivilegedPortConfig:
+    port: Annotated[int, V >= 1024]
 
-class TestMetadataValidatorsNested:
-    def test_nested_field(self, tmp_path: Path):
-        @dataclass
-        class Database:
-            host: str
-            port: int
 
-        @dataclass
-        class Config:
-            database: Database
+@dataclass
+class PortUserConfig:
+    port: int
+    user: str
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"database": {"host": "localhost", "port": 5432}}')
 
+class TestMetadataValidatorsSuccess:
+    def test_single_validator(self):
         metadata = JsonSource(
-            file=json_file,
+            file=StringIO('{"name": "Alice"}'),
             validators={
-                F[Config].database.host: V.len() >= 1,
-                F[Config].database.port: V > 0,
+                F[NameConfig].name: V.len() >= 3,
             },
         )
-        result = load(metadata, schema=Config)
-
-        assert result.database.host == "localhost"
-        assert result.database.port == 5432
+        result = load(metadata, schema=NameConfig)
 
-    def test_nested_field_fails(self, tmp_path: Path):
-        @dataclass
-        class Database:
-            host: str
-            port: int
-
-        @dataclass
-        class Config:
-            database: Database
-
-        json_file = tmp_path / "config.json"
-        content = '{"database": {"host": "", "port": 5432}}'
-        json_file.write_text(content)
+        assert result.name == "Alice"
 
+    def test_tuple_validators(self):
         metadata = JsonSource(
-            file=json_file,
+            file=StringIO('{"port": 8080}'),
             validators={
-                F[Config].database.host: V.len() >= 1,
+                F[PortConfig].port: (V > 0, V < 65536),
             },
         )
+        result = load(metadata, schema=PortConfig)
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            "  [database.host]  Value length must be greater than or equal to 1\n"
-            f"   ├── {content}\n"
-            "   │                         ^^\n"
-            f"   └── FILE '{json_file}', line 1"
-        )
-
-
-class TestMetadataValidatorsComplement:
-    def test_metadata_validators_complement_annotated(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: Annotated[str, V.len() >= 3]
-            port: int
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"name": "Alice", "port": 8080}')
+        assert result.port == 8080
 
+    def test_multiple_fields(self):
         metadata = JsonSource(
-            file=json_file,
+            file=StringIO('{"name": "Alice", "port": 8080}'),
             validators={
-                F[Config].name: V.len() <= 50,
-                F[Config].port: V > 0,
+                F[NamePortConfig].name: V.len() >= 3,
+                F[NamePortConfig].port: V > 0,
             },
         )
-        result = load(metadata, schema=Config)
+        result = load(metadata, schema=NamePortConfig)
 
         assert result.name == "Alice"
         assert result.port == 8080
 
-    def test_annotated_still_validates(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: Annotated[str, V.len() >= 5]
 
-        json_file = tmp_path / "config.json"
+class TestMetadataValidatorsFailure:
+    def test_single_validator_fails(self, json_file_factory: Callable[[str], Path]):
         content = '{"name": "Al"}'
-        json_file.write_text(content)
+        json_file = json_file_factory(content)
 
         metadata = JsonSource(
             file=json_file,
             validators={
-                F[Config].name: V.len() <= 50,
+                F[NameConfig].name: V.len() >= 3,
             },
         )
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            "  [name]  Value length must be greater than or equal to 5\n"
-            f"   ├── {content}\n"
-            "   │             ^^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert_single_field_error(
+            lambda: load(metadata, schema=NameConfig),
+            schema_name="NameConfig",
+            path="name",
+            message="Value length must be greater than or equal to 3",
+            content=content,
+            caret="             ^^",
+            file=json_file,
         )
 
-    def test_metadata_validator_fails_with_annotated_present(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: Annotated[str, V.len() >= 3]
-
-        json_file = tmp_path / "config.json"
-        content = '{"name": "This is a very long name that exceeds the limit"}'
-        json_file.write_text(content)
+    def test_tuple_validator_fails(self, json_file_factory: Callable[[str], Path]):
+        content = '{"port": -1}'
+        json_file = json_file_factory(content)
 
         metadata = JsonSource(
             file=json_file,
             validators={
-                F[Config].name: V.len() <= 10,
+                F[PortConfig].port: (V > 0, V < 65536),
             },
         )
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            "  [name]  Value length must be less than or equal to 10\n"
-            f"   ├── {content}\n"
-            "   │             ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^\n"
-            f"   └── FILE '{json_file}', line 1"
+        assert_single_field_error(
+            lambda: load(metadata, schema=PortConfig),
+            schema_name="PortConfig",
+            path="port",
+            message="Value must be greater than 0",
+            content=content,
+            caret="            ^^",
+            file=json_file,
         )
 
-    def test_both_annotated_and_metadata_on_same_field_pass(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: Annotated[str, V.len() >= 3]
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"name": "Alice"}')
 
+class TestMetadataValidatorsNested:
+    def test_nested_field(self):
         metadata = JsonSource(
-            file=json_file,
+            file=StringIO('{"database": {"host": "localhost", "port": 5432}}'),
             validators={
-                F[Config].name: V.len() <= 10,
+                F[DatabaseConfig].database.host: V.len() >= 1,
+                F[DatabaseConfig].database.port: V > 0,
             },
         )
-        result = load(metadata, schema=Config)
+        result = load(metadata, schema=DatabaseConfig)
 
-        assert result.name == "Alice"
-
-    def test_annotated_fails_while_metadata_would_pass(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: Annotated[str, V.len() >= 5]
+        assert result.database.host == "localhost"
+        assert result.database.port == 5432
 
-        json_file = tmp_path / "config.json"
-        content = '{"name": "AB"}'
-        json_file.write_text(content)
+    def test_nested_field_fails(self, json_file_factory: Callable[[str], Path]):
+        content = '{"database": {"host": "", "port": 5432}}'
+        json_file = json_file_factory(content)
 
         metadata = JsonSource(
             file=json_file,
             validators={
-                F[Config].name: V.len() <= 50,
+                F[DatabaseConfig].database.host: V.len() >= 1,
             },
         )
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            "  [name]  Value length must be greater than or equal to 5\n"
-            f"   ├── {content}\n"
-            "   │             ^^\n"
-            f"   └── FILE '{json_file}', line 1"
-        )
-
-    def test_same_validator_type_in_annotated_and_metadata(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: Annotated[int, V >= 0]
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080}')
-
-        metadata = JsonSource(
+        assert_single_field_error(
+            lambda: load(metadata, schema=DatabaseConfig),
+            schema_name="DatabaseConfig",
+            path="database.host",
+            message="Value length must be greater than or equal to 1",
+            content=content,
+            caret="                         ^^",
             file=json_file,
-            validators={
-                F[Config].port: V < 65536,
-            },
         )
-        result = load(metadata, schema=Config)
 
-        assert result.port == 8080
-
-    def test_same_validator_type_in_annotated_and_metadata_fails(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: Annotated[int, V >= 1024]
-
-        json_file = tmp_path / "config.json"
-        content = '{"port": 80}'
-        json_file.write_text(content)
 
+class TestMetadataValidatorsComplement:
+    def test_metadata_validators_complement_annotated(self):
         metadata = JsonSource(
-            file=json_file,
+            file=StringIO('{"name": "Alice", "port": 8080}'),
             validators={
-                F[Config].port: V < 65536,
+                F[AnnotatedNamePortConfig].name: V.len() <= 50,
+                F[AnnotatedNamePortConfig].port: V > 0,
             },
         )
+        result = load(metadata, schema=AnnotatedNamePortConfig)
 
-        with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
-
-        e = exc_info.value
-        assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
-        assert str(e.exceptions[0]) == (
-            "  [port]  Value must be greater than or equal to 1024\n"
-            f"   ├── {content}\n"
-            "   │            ^^\n"
-            f"   └── FILE '{json_file}', line 1"
-        )
-
-    def test_metadata_fails_while_annotated_passes(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: Annotated[int, V >= 0]
-
-        json_file = tmp_path / "config.json"
-        content = '{"port": 70000}'
-        json_file.write_text(content)
+        assert result.name == "Alice"
+        assert result.port == 8080
 
-        metadata = JsonSource(
-            file=json_file,
-            validators={
-                F[Config].port: V < 65536,
-            },
-        )
+    @pytest.mark.parametrize(
+        ("schema", "validators", "content", "field_name", "expected"),
+        [
+            pytest.param(
+                MinLength3Config,
+                {F[MinLength3Config].name: V.len() <= 10},
+                '{"name": "Alice"}',
+                "name",
+                "Alice",
+                id="same_field_pass",
+            ),
+            pytest.param(
+                NonNegativePortConfig,
+                {F[NonNegativePortConfig].port: V < 65536},
+                '{"port": 8080}',
+                "port",
+                8080,
+                id="same_validator_type_pass",
+            ),
+        ],
+    )
+    def test_both_pass(
+        self,
+        schema: type,
+        validators: dict[FieldPath, Predicate],
+        content: str,
+        field_name: str,
+        expected: object,
+    ):
+        metadata = JsonSource(file=StringIO(content), validators=validators)
+        result: object = load(metadata, schema=schema)
+
+        assert getattr(result, field_name) == expected
+
+    @pytest.mark.parametrize(
+        ("schema", "validators", "content", "message", "caret"),
+        [
+            pytest.param(
+                MinLength5Config,
+                {F[MinLength5Config].name: V.len() <= 50},
+                '{"name": "Al"}',
+                "[name]  Value length must be greater than or equal to 5",
+                "             ^^",
+                id="annotated_still_validates",
+            ),
+            pytest.param(
+                MinLength3Config,
+                {F[MinLength3Config].name: V.len() <= 10},
+                '{"name": "This is a very long name that exceeds the limit"}',
+                "[name]  Value length must be less than or equal to 10",
+                "             " + "^" * 47,
+                id="metadata_fails_with_annotated_present",
+            ),
+            pytest.param(
+                MinLength5Config,
+                {F[MinLength5Config].name: V.len() <= 50},
+                '{"name": "AB"}',
+                "[name]  Value length must be greater than or equal to 5",
+                "             ^^",
+                id="annotated_fails_while_metadata_would_pass",
+            ),
+            pytest.param(
+                UnprivilegedPortConfig,
+                {F[UnprivilegedPortConfig].port: V < 65536},
+                '{"port": 80}',
+                "[port]  Value must be greater than or equal to 1024",
+                "            ^^",
+                id="same_validator_type_annotated_fails",
+            ),
+            pytest.param(
+                NonNegativePortConfig,
+                {F[NonNegativePortConfig].port: V < 65536},
+                '{"port": 70000}',
+                "[port]  Value must be less than 65536",
+                "            ^^^^^",
+                id="metadata_fails_while_annotated_passes",
+            ),
+        ],
+    )
+    def test_one_fails(
+        self,
+        json_file_factory: Callable[[str], Path],
+        schema: type,
+        validators: dict[FieldPath, Predicate],
+        content: str,
+        message: str,
+        caret: str,
+    ):
+        json_file = json_file_factory(content)
+        metadata = JsonSource(file=json_file, validators=validators)
 
         with pytest.raises(DatureConfigError) as exc_info:
-            load(metadata, schema=Config)
+            load(metadata, schema=schema)
 
         e = exc_info.value
         assert len(e.exceptions) == 1
-        assert str(e) == "Config loading errors (1)"
+        assert str(e) == f"{schema.__name__} loading errors (1)"
         assert str(e.exceptions[0]) == (
-            "  [port]  Value must be less than 65536\n"
-            f"   ├── {content}\n"
-            "   │            ^^^^^\n"
-            f"   └── FILE '{json_file}', line 1"
+            f"  {message}\n   ├── {content}\n   │{caret}\n   └── FILE '{json_file}', line 1"
         )
 
 
 class TestMetadataValidatorsNone:
-    def test_validators_none_works(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            name: str
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"name": "Alice"}')
-
-        metadata = JsonSource(file=json_file)
-        result = load(metadata, schema=Config)
+    def test_validators_none_works(self):
+        metadata = JsonSource(file=StringIO('{"name": "Alice"}'))
+        result = load(metadata, schema=NameConfig)
 
         assert result.name == "Alice"
 
 
 class TestMetadataValidatorsWithRootValidators:
-    def test_both_validators_and_root_validators(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: int
-            user: str
-
-        def validate_config(obj: Config) -> bool:
+    def test_both_validators_and_root_validators(self):
+        def validate_config(obj: PortUserConfig) -> bool:
             if obj.port < 1024:
                 return obj.user == "root"
             return True
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080, "user": "admin"}')
-
         metadata = JsonSource(
-            file=json_file,
+            file=StringIO('{"port": 8080, "user": "admin"}'),
             root_validators=(V.root(validate_config),),
             validators={
-                F[Config].port: V >= 0,
+                F[PortUserConfig].port: V >= 0,
             },
         )
-        result = load(metadata, schema=Config)
+        result = load(metadata, schema=PortUserConfig)
 
         assert result.port == 8080
         assert result.user == "admin"
 
 
 class TestMetadataValidatorsDecorator:
-    def test_decorator_with_validators(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"name": "Alice", "age": 25}')
+    def test_decorator_with_validators(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"name": "Alice", "age": 25}')
 
         @dataclass
         class Config:
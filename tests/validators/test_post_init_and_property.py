@@ -1,4 +1,6 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from io import StringIO
 from pathlib import Path
 
 import pytest
@@ -6,84 +8,53 @@ import pytest
 from dature import JsonSource, load
 
 
-class TestPostInitValidationFunctionMode:
-    def test_post_init_success(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: int
-            host: str
+@dataclass
+class PortConfig:
+    port: int
+    host: str
 
-            def __post_init__(self) -> None:
-                if self.port < 0 or self.port > 65535:
-                    msg = f"Invalid port: {self.port}"
-                    raise ValueError(msg)
+    def __post_init__(self) -> None:
+        if self.port < 0 or self.port > 65535:
+            msg = f"Invalid port: {self.port}"
+            raise ValueError(msg)
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080, "host": "localhost"}')
 
-        result = load(JsonSource(file=json_file), schema=Config)
+@dataclass
+class RangeConfig:
+    min_value: int
+    max_value: int
 
-        assert result.port == 8080
-        assert result.host == "localhost"
+    def __post_init__(self) -> None:
+        if self.min_value >= self.max_value:
+            msg = f"min_value ({self.min_value}) must be less than max_value ({self.max_value})"
+            raise ValueError(msg)
 
-    def test_post_init_failure(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            port: int
-            host: str
 
-            def __post_init__(self) -> None:
-                if self.port < 0 or self.port > 65535:
-                    msg = f"Invalid port: {self.port}"
-                    raise ValueError(msg)
+class TestPostInitValidationFunctionMode:
+    def test_post_init_success(self):
+        result = load(JsonSource(file=StringIO('{"port": 8080, "host": "localhost"}')), schema=PortConfig)
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 99999, "host": "localhost"}')
+        assert result.port == 8080
+        assert result.host == "localhost"
 
+    def test_post_init_failure(self):
         with pytest.raises(ValueError, match="Invalid port: 99999"):
-            load(JsonSource(file=json_file), schema=Config)
-
-    def test_post_init_cross_field_validation(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            min_value: int
-            max_value: int
-
-            def __post_init__(self) -> None:
-                if self.min_value >= self.max_value:
-                    msg = f"min_value ({self.min_value}) must be less than max_value ({self.max_value})"
-                    raise ValueError(msg)
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"min_value": 100, "max_value": 10}')
+            load(JsonSource(file=StringIO('{"port": 99999, "host": "localhost"}')), schema=PortConfig)
 
+    def test_post_init_cross_field_validation(self):
         with pytest.raises(ValueError, match=r"min_value \(100\) must be less than max_value \(10\)"):
-            load(JsonSource(file=json_file), schema=Config)
-
-    def test_post_init_cross_field_success(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            min_value: int
-            max_value: int
+            load(JsonSource(file=StringIO('{"min_value": 100, "max_value": 10}')), schema=RangeConfig)
 
-            def __post_init__(self) -> None:
-                if self.min_value >= self.max_value:
-                    msg = f"min_value ({self.min_value}) must be less than max_value ({self.max_value})"
-                    raise ValueError(msg)
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"min_value": 1, "max_value": 100}')
-
-        result = load(JsonSource(file=json_file), schema=Config)
+    def test_post_init_cross_field_success(self):
+        result = load(JsonSource(file=StringIO('{"min_value": 1, "max_value": 100}')), schema=RangeConfig)
 
         assert result.min_value == 1
         assert result.max_value == 100
 
 
 class TestPostInitValidationDecoratorMode:
-    def test_post_init_success(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080, "host": "localhost"}')
+    def test_post_init_success(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"port": 8080, "host": "localhost"}')
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -101,9 +72,8 @@ class TestPostInitValidationDecoratorMode:
         assert config.port == 8080
         assert config.host == "localhost"
 
-    def test_post_init_failure_from_file(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 99999, "host": "localhost"}')
+    def test_post_init_failure_from_file(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"port": 99999, "host": "localhost"}')
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -119,9 +89,8 @@ class TestPostInitValidationDecoratorMode:
         with pytest.raises(ValueError, match="Invalid port: 99999"):
             Config()
 
-    def test_post_init_failure_from_override(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080, "host": "localhost"}')
+    def test_post_init_failure_from_override(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"port": 8080, "host": "localhost"}')
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -137,9 +106,8 @@ class TestPostInitValidationDecoratorMode:
         with pytest.raises(ValueError, match="Invalid port: -1"):
             Config(port=-1)
 
-    def test_post_init_cross_field(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"min_value": 50, "max_value": 10}')
+    def test_post_init_cross_field(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"min_value": 50, "max_value": 10}')
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -157,7 +125,7 @@ class TestPostInitValidationDecoratorMode:
 
 
 class TestPostInitComputedFields:
-    def test_computed_field_via_post_init(self, tmp_path: Path):
+    def test_computed_field_via_post_init(self):
         @dataclass
         class Config:
             host: str
@@ -167,16 +135,12 @@ class TestPostInitComputedFields:
             def __post_init__(self) -> None:
                 self.base_url = f"http://{self.host}:{self.port}"
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"host": "localhost", "port": 8080}')
-
-        result = load(JsonSource(file=json_file), schema=Config)
+        result = load(JsonSource(file=StringIO('{"host": "localhost", "port": 8080}')), schema=Config)
 
         assert result.base_url == "http://localhost:8080"
 
-    def test_computed_field_via_post_init_decorator(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"host": "example.com", "port": 443}')
+    def test_computed_field_via_post_init_decorator(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"host": "example.com", "port": 443}')
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -194,7 +158,7 @@ class TestPostInitComputedFields:
 
 
 class TestPropertyValidation:
-    def test_property_computed_value(self, tmp_path: Path):
+    def test_property_computed_value(self):
         @dataclass
         class Config:
             host: str
@@ -204,16 +168,12 @@ class TestPropertyValidation:
             def address(self) -> str:
                 return f"{self.host}:{self.port}"
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"host": "localhost", "port": 8080}')
-
-        result = load(JsonSource(file=json_file), schema=Config)
+        result = load(JsonSource(file=StringIO('{"host": "localhost", "port": 8080}')), schema=Config)
 
         assert result.address == "localhost:8080"
 
-    def test_property_computed_value_decorator(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"host": "localhost", "port": 3000}')
+    def test_property_computed_value_decorator(self, json_file_factory: Callable[[str], Path]):
+        json_file = json_file_factory('{"host": "localhost", "port": 3000}')
 
         @load(JsonSource(file=json_file))
         @dataclass
@@ -229,7 +189,7 @@ class TestPropertyValidation:
 
         assert config.address == "localhost:3000"
 
-    def test_property_with_validation_logic(self, tmp_path: Path):
+    def test_property_with_validation_logic(self):
         @dataclass
         class Config:
             _email: str
@@ -238,9 +198,6 @@ class TestPropertyValidation:
             def email(self) -> str:
                 return self._email.lower().strip()
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"_email": "  Admin@Example.COM  "}')
-
-        result = load(JsonSource(file=json_file), schema=Config)
+        result = load(JsonSource(file=StringIO('{"_email": "  Admin@Example.COM  "}')), schema=Config)
 
         assert result.email == "admin@example.com"
@@ -1,5 +1,9 @@
 """Unit tests for ``MatchesPredicate``."""
 
+import re
+
+import pytest
+
 from dature import V
 
 
@@ -11,6 +15,53 @@ class TestMatchesRuntime:
         assert func("ABC") is False
         assert func("abc123") is False
 
+    @pytest.mark.parametrize(
+        "pattern",
+        ["", ".*", "^", "^.*", "abc", "^abc", "^abc.*", "^my-app", "^a b_1"],
+    )
+    @pytest.mark.parametrize(
+        "value",
+        ["", "abc", "abcdef", "ab", "xabc", "ABC", "abc\n", "\nabc", "my-app-1", "a b_1 c"],
+    )
+    def test_literal_prefix_agrees_with_re(self, pattern: str, value: str) -> None:
+        func = V.matches(pattern).get_validator_func()
+        assert func(value) is (re.match(pattern, value) is not None)
+
+    def test_identical_patterns_share_compiled_object(self) -> None:
+        first = V.matches(r"^[\w.-]+@[\w.-]+$")
+        second = V.matches(r"^[\w.-]+@[\w.-]+$", error_message="bad email")
+        assert first._compiled is second._compiled
+
+    def test_invalid_pattern_rejected_on_construction(self) -> None:
+        with pytest.raises(re.error):
+            V.matches(r"^[a-z")
+
+    def test_custom_message_keeps_pattern(self) -> None:
+        func = V.matches(r"^\d+$").with_error_message("digits only").get_validator_func()
+        assert func("123") is True
+        assert func("12a") is False
+
+
+class TestMatchesEngine:
+    def test_re_is_default(self) -> None:
+        assert isinstance(V.matches(r"^\d+$")._compiled, re.Pattern)
+
+    def test_re2_matches(self) -> None:
+        pytest.importorskip("re2")
+
+        pred = V.matches(r"^[\w.-]+@[\w.-]+\.\w+$", engine="re2")
+        func = pred.get_validator_func()
+
+        assert not isinstance(pred._compiled, re.Pattern)
+        assert func("user@example.com") is True
+        assert func("not-an-email") is False
+
+    def test_re2_rejects_unsupported_pattern(self) -> None:
+        pytest.importorskip("re2")
+
+        with pytest.raises(ValueError, match=r"RE2 cannot compile this pattern"):
+            V.matches(r"^(a)\1$", engine="re2")
+
 
 class TestMatchesErrorMessage:
     def test_default_message(self) -> None:
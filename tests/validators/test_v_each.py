@@ -1,7 +1,7 @@
 """Integration tests for V.each — per-element validation with trailed field paths."""
 
 from dataclasses import dataclass
-from pathlib import Path
+from io import StringIO
 from typing import Annotated
 
 import pytest
@@ -10,51 +10,46 @@ from dature import JsonSource, V, load
 from dature.errors import DatureConfigError, FieldLoadError
 
 
-def _load_tags(tmp_path: Path, content: str, predicate):
-    @dataclass
-    class Config:
-        tags: Annotated[list[str], predicate]
+@dataclass
+class MinLength3Tags:
+    tags: Annotated[list[str], V.each(V.len() >= 3)]
 
-    json_file = tmp_path / "config.json"
-    json_file.write_text(content)
 
-    with pytest.raises(DatureConfigError) as exc_info:
-        load(JsonSource(file=json_file), schema=Config)
+@dataclass
+class LowercaseTags:
+    tags: Annotated[list[str], V.each((V.len() >= 2) & V.matches(r"^[a-z]+$"))]
 
-    return exc_info.value
 
+@dataclass
+class NonEmptyMinLength3Tags:
+    tags: Annotated[list[str], (V.len() >= 1) & V.each(V.len() >= 3)]
 
-class TestEachHappyPath:
-    def test_empty_list_passes(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            tags: Annotated[list[str], V.each(V.len() >= 3)]
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"tags": []}')
 
-        result = load(JsonSource(file=json_file), schema=Config)
-        assert result.tags == []
+def _load_errors(schema: type, content: str) -> DatureConfigError:
+    with pytest.raises(DatureConfigError) as exc_info:
+        load(JsonSource(file=StringIO(content)), schema=schema)
 
-    def test_all_elements_valid(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            tags: Annotated[list[str], V.each(V.len() >= 3)]
+    return exc_info.value
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"tags": ["abc", "abcd"]}')
 
-        result = load(JsonSource(file=json_file), schema=Config)
-        assert result.tags == ["abc", "abcd"]
+class TestEachHappyPath:
+    @pytest.mark.parametrize(
+        ("schema", "content", "expected"),
+        [
+            pytest.param(MinLength3Tags, '{"tags": []}', [], id="empty_list"),
+            pytest.param(MinLength3Tags, '{"tags": ["abc", "abcd"]}', ["abc", "abcd"], id="all_elements_valid"),
+            pytest.param(LowercaseTags, '{"tags": ["ab", "cde"]}', ["ab", "cde"], id="and_inner"),
+            pytest.param(NonEmptyMinLength3Tags, '{"tags": ["abcd"]}', ["abcd"], id="outer_len_and_each"),
+        ],
+    )
+    def test_passes(self, schema: type, content: str, expected: list[str]):
+        result: object = load(JsonSource(file=StringIO(content)), schema=schema)
+        assert result == schema(tags=expected)
 
 
 class TestEachReportsPerElementFieldPath:
-    def test_single_bad_element_at_index(self, tmp_path: Path):
-        err = _load_tags(
-            tmp_path,
-            '{"tags": ["abc", "ab", "abcd"]}',
-            V.each(V.len() >= 3),
-        )
+    def test_single_bad_element_at_index(self):
+        err = _load_errors(MinLength3Tags, '{"tags": ["abc", "ab", "abcd"]}')
 
         assert len(err.exceptions) == 1
 
@@ -64,61 +59,29 @@ class TestEachReportsPerElementFieldPath:
         assert exc.field_path == ["tags", "1"]
         assert exc.message == "Value length must be greater than or equal to 3"
 
-    def test_multiple_bad_elements(self, tmp_path: Path):
-        err = _load_tags(
-            tmp_path,
-            '{"tags": ["ab", "okay", "x"]}',
-            V.each(V.len() >= 3),
-        )
-
-        field_errors = [exc for exc in err.exceptions if isinstance(exc, FieldLoadError)]
-        assert [exc.field_path for exc in field_errors] == [["tags", "0"], ["tags", "2"]]
-
-
-class TestEachWithComposedInner:
-    def test_and_inner(self, tmp_path: Path):
-        inner = (V.len() >= 2) & V.matches(r"^[a-z]+$")
-
-        @dataclass
-        class Config:
-            tags: Annotated[list[str], V.each(inner)]
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"tags": ["ab", "cde"]}')
-
-        result = load(JsonSource(file=json_file), schema=Config)
-        assert result.tags == ["ab", "cde"]
-
-    def test_and_inner_failure(self, tmp_path: Path):
-        err = _load_tags(
-            tmp_path,
-            '{"tags": ["ab", "CD", "ef"]}',
-            V.each((V.len() >= 2) & V.matches(r"^[a-z]+$")),
-        )
+    @pytest.mark.parametrize(
+        ("schema", "content", "expected_paths"),
+        [
+            pytest.param(
+                MinLength3Tags,
+                '{"tags": ["ab", "okay", "x"]}',
+                [["tags", "0"], ["tags", "2"]],
+                id="multiple_bad_elements",
+            ),
+            pytest.param(LowercaseTags, '{"tags": ["ab", "CD", "ef"]}', [["tags", "1"]], id="and_inner"),
+        ],
+    )
+    def test_bad_elements(self, schema: type, content: str, expected_paths: list[list[str]]):
+        err = _load_errors(schema, content)
 
         field_errors = [exc for exc in err.exceptions if isinstance(exc, FieldLoadError)]
-        assert [exc.field_path for exc in field_errors] == [["tags", "1"]]
+        assert [exc.field_path for exc in field_errors] == expected_paths
 
 
 class TestEachWithOuterPredicates:
-    def test_outer_len_and_each(self, tmp_path: Path):
-        @dataclass
-        class Config:
-            tags: Annotated[list[str], (V.len() >= 1) & V.each(V.len() >= 3)]
-
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"tags": ["abcd"]}')
-
-        result = load(JsonSource(file=json_file), schema=Config)
-        assert result.tags == ["abcd"]
-
-    def test_outer_fails_independently(self, tmp_path: Path):
+    def test_outer_fails_independently(self):
         # Empty list: outer len >= 1 fails; each passes (no elements)
-        err = _load_tags(
-            tmp_path,
-            '{"tags": []}',
-            (V.len() >= 1) & V.each(V.len() >= 3),
-        )
+        err = _load_errors(NonEmptyMinLength3Tags, '{"tags": []}')
 
         field_errors = [exc for exc in err.exceptions if isinstance(exc, FieldLoadError)]
         assert [exc.field_path for exc in field_errors] == [["tags"]]
@@ -126,20 +89,17 @@ class TestEachWithOuterPredicates:
 
 
 class TestEachOnTupleAndSet:
-    def test_tuple(self, tmp_path: Path):
+    def test_tuple(self):
         @dataclass
         class Config:
             tags: Annotated[tuple[str, ...], V.each(V.len() >= 3)]
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"tags": ["abc", "def"]}')
-
-        result = load(JsonSource(file=json_file), schema=Config)
+        result = load(JsonSource(file=StringIO('{"tags": ["abc", "def"]}')), schema=Config)
         assert result.tags == ("abc", "def")
 
 
 class TestNestedDataclassesInList:
-    def test_nested_predicates_still_fire(self, tmp_path: Path):
+    def test_nested_predicates_still_fire(self):
         @dataclass
         class Member:
             name: Annotated[str, V.len() >= 2]
@@ -148,11 +108,8 @@ class TestNestedDataclassesInList:
         class Config:
             members: list[Member]
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"members": [{"name": "A"}, {"name": "Bob"}]}')
-
         with pytest.raises(DatureConfigError) as exc_info:
-            load(JsonSource(file=json_file), schema=Config)
+            load(JsonSource(file=StringIO('{"members": [{"name": "A"}, {"name": "Bob"}]}')), schema=Config)
 
         err = exc_info.value
         assert len(err.exceptions) == 1
@@ -1,6 +1,7 @@
 """Unit + integration tests for V.root — cross-field validation via source.root_validators."""
 
 from dataclasses import dataclass
+from io import StringIO
 from pathlib import Path
 from typing import Annotated
 
@@ -24,6 +25,13 @@ def _privileged_port_requires_root(cfg: _PrivConfig) -> bool:
     return True
 
 
+_PRIVILEGED_PORT_CHECK = V.root(_privileged_port_requires_root)
+_PRIVILEGED_PORT_CHECK_CUSTOM = V.root(
+    _privileged_port_requires_root,
+    error_message="privileged ports require the root user",
+)
+
+
 class TestRootPredicateConstruction:
     def test_v_root_returns_root_predicate(self) -> None:
         def check(_cfg: object) -> bool:
@@ -49,14 +57,11 @@ class TestRootPredicateConstruction:
 
 
 class TestVRootHappyPath:
-    def test_passes_with_valid_values(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080, "user": "alice"}')
-
+    def test_passes_with_valid_values(self):
         result = load(
             JsonSource(
-                file=json_file,
-                root_validators=(V.root(_privileged_port_requires_root),),
+                file=StringIO('{"port": 8080, "user": "alice"}'),
+                root_validators=(_PRIVILEGED_PORT_CHECK,),
             ),
             schema=_PrivConfig,
         )
@@ -64,14 +69,11 @@ class TestVRootHappyPath:
         assert result.port == 8080
         assert result.user == "alice"
 
-    def test_passes_with_privileged_root_user(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 80, "user": "root"}')
-
+    def test_passes_with_privileged_root_user(self):
         result = load(
             JsonSource(
-                file=json_file,
-                root_validators=(V.root(_privileged_port_requires_root),),
+                file=StringIO('{"port": 80, "user": "root"}'),
+                root_validators=(_PRIVILEGED_PORT_CHECK,),
             ),
             schema=_PrivConfig,
         )
@@ -81,15 +83,12 @@ class TestVRootHappyPath:
 
 
 class TestVRootFailure:
-    def test_default_error_message(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 80, "user": "alice"}')
-
+    def test_default_error_message(self):
         with pytest.raises(DatureConfigError) as exc_info:
             load(
                 JsonSource(
-                    file=json_file,
-                    root_validators=(V.root(_privileged_port_requires_root),),
+                    file=StringIO('{"port": 80, "user": "alice"}'),
+                    root_validators=(_PRIVILEGED_PORT_CHECK,),
                 ),
                 schema=_PrivConfig,
             )
@@ -102,20 +101,12 @@ class TestVRootFailure:
         assert exc.field_path == []
         assert exc.message == "Root validation failed"
 
-    def test_custom_error_message(self, tmp_path: Path):
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 80, "user": "alice"}')
-
+    def test_custom_error_message(self):
         with pytest.raises(DatureConfigError) as exc_info:
             load(
                 JsonSource(
-                    file=json_file,
-                    root_validators=(
-                        V.root(
-                            _privileged_port_requires_root,
-                            error_message="privileged ports require the root user",
-                        ),
-                    ),
+                    file=StringIO('{"port": 80, "user": "alice"}'),
+                    root_validators=(_PRIVILEGED_PORT_CHECK_CUSTOM,),
                 ),
                 schema=_PrivConfig,
             )
@@ -127,20 +118,17 @@ class TestVRootFailure:
 
 
 class TestMultipleRootValidators:
-    def test_both_validators_run(self, tmp_path: Path):
+    def test_both_validators_run(self):
         def never_passes(_: _PrivConfig) -> bool:
             return False
 
         def always_passes(_: _PrivConfig) -> bool:
             return True
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080, "user": "alice"}')
-
         with pytest.raises(DatureConfigError) as exc_info:
             load(
                 JsonSource(
-                    file=json_file,
+                    file=StringIO('{"port": 8080, "user": "alice"}'),
                     root_validators=(
                         V.root(never_passes, error_message="first check failed"),
                         V.root(always_passes),
@@ -159,56 +147,54 @@ class TestRootValidatorsContainerShape:
     """root_validators accepts any iterable of RootPredicate; rejects scalars and string-likes."""
 
     @pytest.fixture
-    def json_file(self, tmp_path: Path) -> Path:
-        f = tmp_path / "config.json"
-        f.write_text('{"port": 8080, "user": "alice"}')
-        return f
+    def config_stream(self) -> StringIO:
+        return StringIO('{"port": 8080, "user": "alice"}')
 
-    def test_accepts_list(self, json_file: Path):
+    def test_accepts_list(self, config_stream: StringIO):
         result = load(
             JsonSource(
-                file=json_file,
-                root_validators=[V.root(_privileged_port_requires_root)],
+                file=config_stream,
+                root_validators=[_PRIVILEGED_PORT_CHECK],
             ),
             schema=_PrivConfig,
         )
         assert result.port == 8080
 
-    def test_accepts_tuple(self, json_file: Path):
+    def test_accepts_tuple(self, config_stream: StringIO):
         result = load(
             JsonSource(
-                file=json_file,
-                root_validators=(V.root(_privileged_port_requires_root),),
+                file=config_stream,
+                root_validators=(_PRIVILEGED_PORT_CHECK,),
             ),
             schema=_PrivConfig,
         )
         assert result.port == 8080
 
-    def test_rejects_bare_root_predicate_missing_comma(self, json_file: Path):
+    def test_rejects_bare_root_predicate_missing_comma(self, config_stream: StringIO):
         with pytest.raises(TypeError, match=r"must be iterable"):
             load(
                 JsonSource(
-                    file=json_file,
-                    root_validators=V.root(_privileged_port_requires_root),
+                    file=config_stream,
+                    root_validators=_PRIVILEGED_PORT_CHECK,
                 ),
                 schema=_PrivConfig,
             )
 
-    def test_rejects_dict(self, json_file: Path):
+    def test_rejects_dict(self, config_stream: StringIO):
         with pytest.raises(TypeError, match=r"must be a sequence"):
             load(
                 JsonSource(
-                    file=json_file,
-                    root_validators={"a": V.root(_privileged_port_requires_root)},  # type: ignore[dict-item]
+                    file=config_stream,
+                    root_validators={"a": _PRIVILEGED_PORT_CHECK},  # type: ignore[dict-item]
                 ),
                 schema=_PrivConfig,
             )
 
-    def test_rejects_string(self, json_file: Path):
+    def test_rejects_string(self, config_stream: StringIO):
         with pytest.raises(TypeError, match=r"must be a sequence"):
             load(
                 JsonSource(
-                    file=json_file,
+                    file=config_stream,
                     root_validators="not a container",
                 ),
                 schema=_PrivConfig,
@@ -217,26 +203,24 @@ class TestRootValidatorsContainerShape:
 
 class TestRootValidatorsElementTypeChecks:
     @pytest.fixture
-    def json_file(self, tmp_path: Path) -> Path:
-        f = tmp_path / "config.json"
-        f.write_text('{"port": 8080, "user": "alice"}')
-        return f
+    def config_stream(self) -> StringIO:
+        return StringIO('{"port": 8080, "user": "alice"}')
 
-    def test_rejects_field_level_predicate(self, json_file: Path):
+    def test_rejects_field_level_predicate(self, config_stream: StringIO):
         with pytest.raises(TypeError, match=r"field-level predicate"):
             load(
                 JsonSource(
-                    file=json_file,
+                    file=config_stream,
                     root_validators=(V >= 1,),
                 ),
                 schema=_PrivConfig,
             )
 
-    def test_rejects_unrelated_object(self, json_file: Path):
+    def test_rejects_unrelated_object(self, config_stream: StringIO):
         with pytest.raises(TypeError, match=r"must contain V\.root"):
             load(
                 JsonSource(
-                    file=json_file,
+                    file=config_stream,
                     root_validators=("not a root predicate",),
                 ),
                 schema=_PrivConfig,
@@ -255,20 +239,17 @@ class TestRootPredicateRejectedInAnnotated:
         with pytest.raises(TypeError, match=r"source\.root_validators"):
             load(JsonSource(file=json_file), schema=Bad)
 
-    def test_root_in_source_validators_raises(self, tmp_path: Path):
+    def test_root_in_source_validators_raises(self):
         @dataclass
         class Cfg:
             port: int
 
         from dature.field_path import F  # noqa: PLC0415
 
-        json_file = tmp_path / "config.json"
-        json_file.write_text('{"port": 8080}')
-
         with pytest.raises(TypeError, match=r"source\.root_validators"):
             load(
                 JsonSource(
-                    file=json_file,
+                    file=StringIO('{"port": 8080}'),
                     validators={F[Cfg].port: V.root(lambda _: True)},  # type: ignore[dict-item]
                 ),
                 schema=Cfg,
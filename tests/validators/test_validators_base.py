@@ -1,19 +1,23 @@
 """Tests for validators/base.py — extract and create validator providers."""
 
 from dataclasses import dataclass
+from io import StringIO
 from typing import Annotated
 
 import pytest
+from adaptix.load_error import AggregateLoadError
 
-from dature import V
+from dature import JsonSource, V
 from dature.errors import ValidatorTypeError
 from dature.field_path import FieldPath
+from dature.sources.retort import create_validating_retort
 from dature.validators.base import (
     create_metadata_validator_providers,
     create_root_validator_providers,
     create_validator_providers,
     extract_and_check_validators,
 )
+from dature.validators.predicate import Predicate
 
 
 class TestExtractAndCheckValidators:
@@ -76,6 +80,94 @@ class TestCreateValidatorProviders:
 
         assert len(result) == 1
 
+    @pytest.mark.parametrize(
+        "predicates",
+        [
+            pytest.param([V.len() >= 3, V.len() <= 20], id="range"),
+            pytest.param([V.len() > 2, V.len() < 21, V.len() >= 1], id="length_run"),
+            pytest.param([V.len() >= 3, V.matches("^a"), V.len() <= 20], id="mixed"),
+            pytest.param([V.len() >= 3, V.each(V.len() >= 1)], id="with_each"),
+        ],
+    )
+    def test_field_predicates_fused(self, predicates: list[Predicate]):
+        @dataclass
+        class Cfg:
+            name: str
+
+        result = create_validator_providers(Cfg, "name", predicates)
+
+        assert len(result) == 1
+
+    def test_no_predicates_no_providers(self):
+        @dataclass
+        class Cfg:
+            name: str
+
+        assert create_validator_providers(Cfg, "name", []) == []
+
+    @pytest.mark.parametrize(
+        ("value", "message"),
+        [
+            pytest.param("abc", None, id="within"),
+            pytest.param("abcde", None, id="at_upper"),
+            pytest.param("ab", "Value length must be greater than 2", id="below"),
+            pytest.param("abcdef", "Value length must be less than or equal to 5", id="above"),
+            pytest.param("abcd", "Value length must not be equal to 4", id="ne_after_range"),
+        ],
+    )
+    def test_fused_length_bounds_report_failing_bound(self, value: str, message: str | None):
+        @dataclass
+        class Cfg:
+            name: Annotated[str, (V.len() > 2) & (V.len() <= 5) & (V.len() != 4)]
+
+        loader = create_validating_retort(JsonSource(file=StringIO("{}")), Cfg).get_loader(Cfg)
+
+        try:
+            loader({"name": value})
+        except AggregateLoadError as exc:
+            errors = [str(sub.msg) for sub in exc.exceptions]
+        else:
+            errors = []
+        assert errors == ([message] if message is not None else [])
+
+    @pytest.mark.parametrize(
+        ("value", "message"),
+        [
+            pytest.param("abc", None, id="valid"),
+            pytest.param("ABC", "Value must match pattern '^[a-z]+$'", id="pattern"),
+            pytest.param("AB", "Value length must be greater than or equal to 3", id="last_failing_wins"),
+            pytest.param("root", "Value must not be equal to root", id="compare"),
+        ],
+    )
+    def test_fused_predicates_report_last_failing(self, value: str, message: str | None):
+        @dataclass
+        class Cfg:
+            name: Annotated[str, V.matches(r"^[a-z]+$") & (V.len() >= 3) & (V != "root")]
+
+        loader = create_validating_retort(JsonSource(file=StringIO("{}")), Cfg).get_loader(Cfg)
+
+        try:
+            loader({"name": value})
+        except AggregateLoadError as exc:
+            errors = [str(sub.msg) for sub in exc.exceptions]
+        else:
+            errors = []
+        assert errors == ([message] if message is not None else [])
+
+    def test_fused_error_when_check_passes_on_rerun(self):
+        results = iter([False, True])
+
+        @dataclass
+        class Cfg:
+            name: Annotated[str, (V.len() >= 1) & V.check(lambda _: next(results), error_message="flaky")]
+
+        loader = create_validating_retort(JsonSource(file=StringIO("{}")), Cfg).get_loader(Cfg)
+
+        with pytest.raises(AggregateLoadError) as exc_info:
+            loader({"name": "abc"})
+
+        assert [str(sub.msg) for sub in exc_info.value.exceptions] == ["flaky"]
+
 
 class TestCreateMetadataValidatorProviders:
     def test_single_field_validator(self):
@@ -96,7 +188,7 @@ class TestCreateMetadataValidatorProviders:
         fp = FieldPath(owner=Cfg, parts=("value",))
         result = create_metadata_validator_providers({fp: (V > 0, V >= 0)})
 
-        assert len(result) == 2
+        assert len(result) == 1
 
     def test_and_composition_flattens(self):
         @dataclass
@@ -106,7 +198,7 @@ class TestCreateMetadataValidatorProviders:
         fp = FieldPath(owner=Cfg, parts=("value",))
         result = create_metadata_validator_providers({fp: (V > 0) & (V < 100)})
 
-        assert len(result) == 2
+        assert len(result) == 1
 
     def test_empty_field_path_raises(self):
         @dataclass